@@ -37,7 +37,7 @@ async def setup_events(bot: commands.Bot):
             print(f"Failed to sync commands globally: {e}")
         
         # Initialize Whisper
-        model_name = os.getenv("WHISPER_MODEL", "base")
+        model_name = os.getenv("WHISPER_MODEL", "tiny.en")
         print(f"Initializing Whisper with model: {model_name}")
         initialize_whisper(model_name)
         print("Bot is ready!")
@@ -3,21 +3,24 @@
 import discord
 from discord.ext import commands
 import asyncio
+import time
 from datetime import datetime
 from typing import Optional, Dict, List
 import uuid
 
 from game.session_manager import session_manager
-from game.scoring import calculate_score, is_successful_attempt
+from game.scoring import calculate_score
 from voice.handler import VoiceHandler
-from voice.recorder import AudioRecorder
 from voice.speech_to_text import get_whisper
 from utils.text_similarity import calculate_accuracy, find_differences
 from utils.embeds import create_twister_challenge_embed, create_results_embed
-from data.tongue_twisters import get_random_twister
+from data.tongue_twisters import get_random_twisters
 from database.manager import db_manager
 import config
 
+# Accuracy needed for an attempt to count as successful
+_SUCCESS_THRESHOLD = config.MIN_ACCURACY_SUCCESS
+
 
 class CompetitiveCommands(commands.Cog):
     """Competitive play commands."""
@@ -123,76 +126,92 @@ class CompetitiveCommands(commands.Cog):
         challenger_wins = 0
         opponent_wins = 0
         rounds_to_win = config.DUEL_BEST_OF // 2 + 1
+        pending_attempts = []
         
-        for round_num in range(1, config.DUEL_BEST_OF + 1):
-            if challenger_wins >= rounds_to_win or opponent_wins >= rounds_to_win:
-                break
-            
-            # Get random twister (increasing difficulty)
-            if round_num <= 2:
-                difficulty = 'easy'
-            elif round_num <= 4:
-                difficulty = 'medium'
-            else:
-                difficulty = 'hard'
-            
-            twister = get_random_twister(difficulty)
-            
-            await ctx.followup.send(
-                f"⚔️ **ROUND {round_num}/{config.DUEL_BEST_OF}** ⚔️\n\n"
-                f"Both players will say:\n"
-                f"**\"{twister['text']}\"**\n\n"
-                f"{challenger.mention}, you're up first!\n"
-                f"I'm listening...",
-                ephemeral=False
-            )
-            
-            # Challenger's turn
-            challenger_score = await self._process_player_attempt(
-                ctx, voice_client, challenger, twister, round_num
-            )
-            
-            if challenger_score is None:
-                await ctx.followup.send("❌ Challenger's attempt failed. Skipping round...")
-                continue
-            
-            await ctx.followup.send(
-                f"{challenger.mention}: **{challenger_score['score']:,} points** "
-                f"({challenger_score['accuracy']:.1f}% accuracy, {challenger_score['time']:.1f}s)"
-            )
-            
-            await ctx.followup.send(f"Now {ctx.author.mention}'s turn!\nI'm listening...")
-            
-            # Opponent's turn
-            opponent_score = await self._process_player_attempt(
-                ctx, voice_client, ctx.author, twister, round_num
-            )
-            
-            if opponent_score is None:
-                await ctx.followup.send("❌ Opponent's attempt failed. Skipping round...")
-                continue
-            
-            await ctx.followup.send(
-                f"{ctx.author.mention}: **{opponent_score['score']:,} points** "
-                f"({opponent_score['accuracy']:.1f}% accuracy, {opponent_score['time']:.1f}s)"
-            )
-            
-            # Determine round winner
-            if challenger_score['score'] > opponent_score['score']:
-                challenger_wins += 1
-                winner = challenger.mention
-            elif opponent_score['score'] > challenger_score['score']:
-                opponent_wins += 1
-                winner = ctx.author.mention
-            else:
-                winner = "Tie"
-            
-            await ctx.followup.send(
-                f"🎉 {winner} wins Round {round_num}!\n\n"
-                f"Score: {challenger.mention}: {challenger_wins} | {ctx.author.mention}: {opponent_wins}"
-            )
-            
-            await asyncio.sleep(2)
+        # Draw every round's twister up front (increasing difficulty: 2 easy, 2 medium, rest hard)
+        round_twisters = (
+            get_random_twisters(min(config.DUEL_BEST_OF, 2), 'easy')
+            + get_random_twisters(max(0, min(config.DUEL_BEST_OF, 4) - 2), 'medium')
+            + get_random_twisters(max(0, config.DUEL_BEST_OF - 4), 'hard')
+        )
+        
+        try:
+            for round_num, twister in enumerate(round_twisters, 1):
+                if challenger_wins >= rounds_to_win or opponent_wins >= rounds_to_win:
+                    break
+                
+                # One message per round, edited in place as the round progresses
+                round_embed = discord.Embed(
+                    title=f"⚔️ ROUND {round_num}/{config.DUEL_BEST_OF} ⚔️",
+                    description=f"Both players will say:\n**\"{twister['text']}\"**",
+                    color=discord.Color.orange()
+                )
+                round_embed.add_field(
+                    name="Status",
+                    value=f"{challenger.mention}, you're up first!\nI'm listening...",
+                    inline=False
+                )
+                round_message = await ctx.followup.send(embed=round_embed, wait=True)
+                
+                # Challenger's turn
+                challenger_score = await self._process_player_attempt(
+                    ctx, voice_client, challenger, twister, round_num, pending_attempts
+                )
+                
+                if challenger_score is None:
+                    round_embed.set_field_at(0, name="Status", value="❌ Challenger's attempt failed. Skipping round...", inline=False)
+                    await round_message.edit(embed=round_embed)
+                    continue
+                
+                round_embed.add_field(
+                    name=challenger.display_name,
+                    value=f"**{challenger_score['score']:,} points** "
+                          f"({challenger_score['accuracy']:.1f}% accuracy, {challenger_score['time']:.1f}s)",
+                    inline=True
+                )
+                round_embed.set_field_at(0, name="Status", value=f"Now {ctx.author.mention}'s turn!\nI'm listening...", inline=False)
+                await round_message.edit(embed=round_embed)
+                
+                # Opponent's turn
+                opponent_score = await self._process_player_attempt(
+                    ctx, voice_client, ctx.author, twister, round_num, pending_attempts
+                )
+                
+                if opponent_score is None:
+                    round_embed.set_field_at(0, name="Status", value="❌ Opponent's attempt failed. Skipping round...", inline=False)
+                    await round_message.edit(embed=round_embed)
+                    continue
+                
+                round_embed.add_field(
+                    name=ctx.author.display_name,
+                    value=f"**{opponent_score['score']:,} points** "
+                          f"({opponent_score['accuracy']:.1f}% accuracy, {opponent_score['time']:.1f}s)",
+                    inline=True
+                )
+                
+                # Determine round winner
+                if challenger_score['score'] > opponent_score['score']:
+                    challenger_wins += 1
+                    winner = challenger.mention
+                elif opponent_score['score'] > challenger_score['score']:
+                    opponent_wins += 1
+                    winner = ctx.author.mention
+                else:
+                    winner = "Tie"
+                
+                round_embed.set_field_at(
+                    0,
+                    name="Status",
+                    value=f"🎉 {winner} wins Round {round_num}!\n\n"
+                          f"Score: {challenger.mention}: {challenger_wins} | {ctx.author.mention}: {opponent_wins}",
+                    inline=False
+                )
+                await round_message.edit(embed=round_embed)
+                
+                await asyncio.sleep(2)
+        finally:
+            # Write queued attempts even if the round loop ends on an error
+            await db_manager.save_attempts(pending_attempts)
         
         # Determine match winner
         if challenger_wins > opponent_wins:
@@ -227,14 +246,15 @@ class CompetitiveCommands(commands.Cog):
         voice_client: discord.VoiceClient,
         player: discord.Member,
         twister: dict,
-        round_num: int
+        round_num: int,
+        pending_attempts: List[Dict]
     ) -> Optional[Dict]:
-        """Process a player's attempt in a duel."""
+        """Process a player's attempt in a duel, queueing it on pending_attempts."""
         # Record audio
-        recorder = AudioRecorder(voice_client)
-        audio_file = await recorder.record_user_audio(player.id, config.VOICE_RECORDING_TIMEOUT)
+        recorder = self.voice_handler.get_recorder(voice_client)
+        recording = await recorder.record_user_audio(player.id, config.VOICE_RECORDING_TIMEOUT)
         
-        if not audio_file:
+        if not recording:
             return None
         
         # Transcribe
@@ -242,46 +262,38 @@ class CompetitiveCommands(commands.Cog):
         if not whisper:
             return None
         
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         # Pass the target text as initial prompt to help Whisper transcribe correctly
-        spoken_text = await whisper.transcribe(audio_file, initial_prompt=twister['text'])
+        transcribe_task = asyncio.create_task(
+            whisper.transcribe(recording, initial_prompt=twister['text'])
+        )
+        
+        # Warm up the player record while Whisper is busy
+        spoken_text, _ = await asyncio.gather(
+            transcribe_task,
+            db_manager.get_or_create_player(str(player.id), player.display_name)
+        )
         
         if not spoken_text:
             return None
         
         # Calculate score
-        accuracy = calculate_accuracy(spoken_text, twister['text'])
-        time_seconds = (datetime.utcnow() - start_time).total_seconds()
+        accuracy = calculate_accuracy(spoken_text, twister['text'], twister['normalized'])
+        time_seconds = time.monotonic() - start_time
         score = calculate_score(accuracy, time_seconds, twister['difficulty'])
         
-        # Save to database
-        await db_manager.get_or_create_player(str(player.id), player.display_name)
-        await db_manager.save_attempt(
-            str(player.id),
-            twister['id'],
-            spoken_text,
-            accuracy,
-            time_seconds,
-            score,
-            twister['difficulty'],
-            'duel',
-            None
-        )
-        await db_manager.update_player_stats(
-            str(player.id),
-            accuracy,
-            time_seconds,
-            score,
-            twister['id'],
-            is_successful_attempt(accuracy)
-        )
-        
-        # Cleanup
-        try:
-            import os
-            os.remove(audio_file)
-        except:
-            pass
+        # Queue for the database; the duel writes all rounds in one batch
+        pending_attempts.append({
+            'user_id': str(player.id),
+            'twister_id': twister['id'],
+            'spoken_text': spoken_text,
+            'accuracy': accuracy,
+            'time_seconds': time_seconds,
+            'score': score,
+            'difficulty': twister['difficulty'],
+            'session_type': 'duel',
+            'is_successful': accuracy >= _SUCCESS_THRESHOLD
+        })
         
         return {
             'score': score,
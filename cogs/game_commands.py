@@ -4,22 +4,20 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
+import time
 from datetime import datetime, date
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 import uuid
-import aiosqlite
-import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from game.session_manager import session_manager
-from game.scoring import calculate_score, is_successful_attempt
+from game.scoring import calculate_score
 from game.session import TwisterSession
 from voice.handler import VoiceHandler
-from voice.recorder import AudioRecorder
 from voice.speech_to_text import get_whisper
-from utils.text_similarity import calculate_accuracy, find_differences
+from utils.text_similarity import calculate_accuracy, score_attempt
 from utils.embeds import (
     create_session_started_embed,
     create_twister_challenge_embed,
@@ -31,13 +29,18 @@ from utils.embeds import (
 )
 from data.tongue_twisters import (
     get_random_twister,
+    get_random_twisters,
     get_twister_by_id,
     get_all_twisters,
-    get_twisters_by_difficulty
+    get_twisters_by_difficulty,
+    get_normalized_text
 )
 from database.manager import db_manager
 import config
 
+# Accuracy needed for an attempt to count as successful
+_SUCCESS_THRESHOLD = config.MIN_ACCURACY_SUCCESS
+
 
 class GameCommands(commands.Cog):
     """Game commands for tongue twister challenges."""
@@ -117,7 +120,8 @@ class GameCommands(commands.Cog):
             await db_manager.end_session(
                 session.session_id,
                 session.attempts,
-                session.total_score
+                session.total_score,
+                session.ended_at
             )
         
         # Leave voice channel
@@ -171,7 +175,7 @@ class GameCommands(commands.Cog):
         # Update session
         session.current_twister_id = twister['id']
         session.waiting_for_attempt = True
-        session.attempt_started_at = datetime.utcnow()
+        session.attempt_started_at = time.monotonic()
         
         # Send challenge embed
         embed = create_twister_challenge_embed(
@@ -189,10 +193,10 @@ class GameCommands(commands.Cog):
             return
         
         # Record audio
-        recorder = AudioRecorder(voice_client)
-        audio_file = await recorder.record_user_audio(interaction.user.id, config.VOICE_RECORDING_TIMEOUT)
+        recorder = self.voice_handler.get_recorder(voice_client)
+        recording = await recorder.record_user_audio(interaction.user.id, config.VOICE_RECORDING_TIMEOUT)
         
-        if not audio_file:
+        if not recording:
             await interaction.followup.send("❌ Failed to record audio. Make sure your microphone is working!", ephemeral=True)
             session.waiting_for_attempt = False
             return
@@ -207,21 +211,18 @@ class GameCommands(commands.Cog):
         await interaction.followup.send("🎤 Processing your speech...", ephemeral=True)
         
         # Pass the target text as initial prompt to help Whisper transcribe correctly
-        spoken_text = await whisper.transcribe(audio_file, initial_prompt=twister['text'])
+        spoken_text = await whisper.transcribe(recording, initial_prompt=twister['text'])
         
         if not spoken_text:
             await interaction.followup.send("❌ Could not understand your speech. Try speaking more clearly!", ephemeral=True)
             session.waiting_for_attempt = False
             return
         
-        # Calculate accuracy and score
-        accuracy = calculate_accuracy(spoken_text, twister['text'])
-        time_seconds = (datetime.utcnow() - session.attempt_started_at).total_seconds()
+        # Calculate accuracy, mistakes and score
+        accuracy, mistakes = score_attempt(spoken_text, twister['text'], twister['normalized'])
+        time_seconds = time.monotonic() - session.attempt_started_at
         score = calculate_score(accuracy, time_seconds, twister['difficulty'])
-        is_successful = is_successful_attempt(accuracy)
-        
-        # Find mistakes
-        mistakes = find_differences(spoken_text, twister['text'])
+        is_successful = accuracy >= _SUCCESS_THRESHOLD
         
         # Update session
         session.attempts += 1
@@ -232,7 +233,7 @@ class GameCommands(commands.Cog):
         
         # Save to database
         await db_manager.get_or_create_player(str(interaction.user.id), interaction.user.display_name)
-        attempt_id = await db_manager.save_attempt(
+        attempt_id = await db_manager.record_attempt(
             str(interaction.user.id),
             twister['id'],
             spoken_text,
@@ -241,16 +242,9 @@ class GameCommands(commands.Cog):
             score,
             twister['difficulty'],
             session.mode,
+            is_successful,
             session.session_id
         )
-        await db_manager.update_player_stats(
-            str(interaction.user.id),
-            accuracy,
-            time_seconds,
-            score,
-            twister['id'],
-            is_successful
-        )
         
         # Send results
         embed = create_results_embed(
@@ -263,14 +257,6 @@ class GameCommands(commands.Cog):
             mistakes
         )
         await interaction.followup.send(embed=embed)
-        
-        # Cleanup audio file (wait a bit to ensure transcription is done)
-        try:
-            await asyncio.sleep(0.5)  # Small delay to ensure file operations are complete
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-        except Exception as e:
-            print(f"[WARNING] Could not delete audio file {audio_file}: {e}")
     
     @app_commands.command(name="twister_practice", description="Practice a specific tongue twister")
     @app_commands.describe(twister_id="Tongue twister ID (1-20)")
@@ -302,7 +288,7 @@ class GameCommands(commands.Cog):
         # Update session
         session.current_twister_id = twister['id']
         session.waiting_for_attempt = True
-        session.attempt_started_at = datetime.utcnow()
+        session.attempt_started_at = time.monotonic()
         session.mode = 'practice'
         
         # Send challenge embed
@@ -321,10 +307,10 @@ class GameCommands(commands.Cog):
             return
         
         # Record audio
-        recorder = AudioRecorder(voice_client)
-        audio_file = await recorder.record_user_audio(interaction.user.id, config.VOICE_RECORDING_TIMEOUT)
+        recorder = self.voice_handler.get_recorder(voice_client)
+        recording = await recorder.record_user_audio(interaction.user.id, config.VOICE_RECORDING_TIMEOUT)
         
-        if not audio_file:
+        if not recording:
             await interaction.followup.send("❌ Failed to record audio. Make sure your microphone is working!", ephemeral=True)
             session.waiting_for_attempt = False
             return
@@ -338,7 +324,7 @@ class GameCommands(commands.Cog):
         
         await interaction.followup.send("🎤 Processing your speech...", ephemeral=True)
         
-        spoken_text = await whisper.transcribe(audio_file)
+        spoken_text = await whisper.transcribe(recording)
         
         if not spoken_text:
             await interaction.followup.send("❌ Could not understand your speech. Try speaking more clearly!", ephemeral=True)
@@ -346,9 +332,8 @@ class GameCommands(commands.Cog):
             return
         
         # Calculate accuracy (no scoring in practice mode)
-        accuracy = calculate_accuracy(spoken_text, twister['text'])
-        time_seconds = (datetime.utcnow() - session.attempt_started_at).total_seconds()
-        mistakes = find_differences(spoken_text, twister['text'])
+        accuracy, mistakes = score_attempt(spoken_text, twister['text'], twister['normalized'])
+        time_seconds = time.monotonic() - session.attempt_started_at
         
         # Update session
         session.attempts += 1
@@ -372,14 +357,6 @@ class GameCommands(commands.Cog):
             inline=False
         )
         await interaction.followup.send(embed=embed)
-        
-        # Cleanup audio file (wait a bit to ensure transcription is done)
-        try:
-            await asyncio.sleep(0.5)  # Small delay to ensure file operations are complete
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-        except Exception as e:
-            print(f"[WARNING] Could not delete audio file {audio_file}: {e}")
     
     @app_commands.command(name="twister_list", description="View all tongue twisters")
     @app_commands.describe(difficulty="Filter by difficulty")
@@ -442,120 +419,109 @@ class GameCommands(commands.Cog):
         # Run challenge
         cumulative_score = 0
         results = []
+        pending_attempts = []
+        await db_manager.get_or_create_player(str(interaction.user.id), interaction.user.display_name)
         
-        for i in range(config.CHALLENGE_TWISTER_COUNT):
-            # Get random twister (mix of difficulties)
-            if i < 3:
-                difficulty = 'easy'
-            elif i < 7:
-                difficulty = 'medium'
-            else:
-                difficulty = 'hard'
-            
-            twister = get_random_twister(difficulty)
-            
-            # Update session
-            session.current_twister_id = twister['id']
-            session.waiting_for_attempt = True
-            session.attempt_started_at = datetime.utcnow()
-            
-            # Send progress
-            embed = create_challenge_progress_embed(
-                i + 1,
-                config.CHALLENGE_TWISTER_COUNT,
-                twister['text'],
-                twister['difficulty'],
-                cumulative_score
-            )
-            await interaction.followup.send(embed=embed)
-            
-            # Get voice client
-            voice_client = self.voice_handler.get_voice_client(interaction.user.voice.channel.id)
-            if not voice_client:
-                await interaction.followup.send("❌ Voice connection lost!", ephemeral=True)
-                break
-            
-            # Record audio
-            recorder = AudioRecorder(voice_client)
-            audio_file = await recorder.record_user_audio(
-                interaction.user.id,
-                config.CHALLENGE_TIME_PER_TWISTER
-            )
-            
-            if not audio_file:
-                await interaction.followup.send("❌ Failed to record audio. Skipping...", ephemeral=True)
-                continue
-            
-            # Transcribe
-            whisper = get_whisper()
-            if not whisper:
-                await interaction.followup.send("❌ Speech recognition not initialized!", ephemeral=True)
-                break
-            
-            # Pass the target text as initial prompt to help Whisper transcribe correctly
-            spoken_text = await whisper.transcribe(audio_file, initial_prompt=twister['text'])
-            
-            if not spoken_text:
-                await interaction.followup.send("❌ Could not understand speech. Skipping...", ephemeral=True)
-                continue
-            
-            # Calculate score
-            accuracy = calculate_accuracy(spoken_text, twister['text'])
-            time_seconds = (datetime.utcnow() - session.attempt_started_at).total_seconds()
-            score = calculate_score(accuracy, time_seconds, twister['difficulty'])
-            is_successful = is_successful_attempt(accuracy)
-            
-            cumulative_score += score
-            session.total_score += score
-            session.attempts += 1
-            if is_successful:
-                session.successful_attempts += 1
-            
-            # Save result
-            results.append({
-                'text': twister['text'],
-                'accuracy': accuracy,
-                'time': time_seconds,
-                'score': score,
-                'difficulty': twister['difficulty']
-            })
-            
-            # Save to database
-            await db_manager.get_or_create_player(str(interaction.user.id), interaction.user.display_name)
-            await db_manager.save_attempt(
-                str(interaction.user.id),
-                twister['id'],
-                spoken_text,
-                accuracy,
-                time_seconds,
-                score,
-                twister['difficulty'],
-                'challenge',
-                session.session_id
-            )
-            await db_manager.update_player_stats(
-                str(interaction.user.id),
-                accuracy,
-                time_seconds,
-                score,
-                twister['id'],
-                is_successful
-            )
-            
-            # Cleanup
-            try:
-                os.remove(audio_file)
-            except:
-                pass
-            
-            session.twisters_completed += 1
+        # Draw all twisters up front (mix of difficulties: 3 easy, 4 medium, rest hard)
+        twister_count = config.CHALLENGE_TWISTER_COUNT
+        challenge_twisters = (
+            get_random_twisters(min(twister_count, 3), 'easy')
+            + get_random_twisters(max(0, min(twister_count, 7) - 3), 'medium')
+            + get_random_twisters(max(0, twister_count - 7), 'hard')
+        )
+        
+        try:
+            for i, twister in enumerate(challenge_twisters):
+                # Update session
+                session.current_twister_id = twister['id']
+                session.waiting_for_attempt = True
+                session.attempt_started_at = time.monotonic()
+                
+                # Send progress
+                embed = create_challenge_progress_embed(
+                    i + 1,
+                    config.CHALLENGE_TWISTER_COUNT,
+                    twister['text'],
+                    twister['difficulty'],
+                    cumulative_score
+                )
+                await interaction.followup.send(embed=embed)
+                
+                # Get voice client
+                voice_client = self.voice_handler.get_voice_client(interaction.user.voice.channel.id)
+                if not voice_client:
+                    await interaction.followup.send("❌ Voice connection lost!", ephemeral=True)
+                    break
+                
+                # Record audio
+                recorder = self.voice_handler.get_recorder(voice_client)
+                recording = await recorder.record_user_audio(
+                    interaction.user.id,
+                    config.CHALLENGE_TIME_PER_TWISTER
+                )
+                
+                if not recording:
+                    await interaction.followup.send("❌ Failed to record audio. Skipping...", ephemeral=True)
+                    continue
+                
+                # Transcribe
+                whisper = get_whisper()
+                if not whisper:
+                    await interaction.followup.send("❌ Speech recognition not initialized!", ephemeral=True)
+                    break
+                
+                # Pass the target text as initial prompt to help Whisper transcribe correctly
+                spoken_text = await whisper.transcribe(recording, initial_prompt=twister['text'])
+                
+                if not spoken_text:
+                    await interaction.followup.send("❌ Could not understand speech. Skipping...", ephemeral=True)
+                    continue
+                
+                # Calculate score
+                accuracy = calculate_accuracy(spoken_text, twister['text'], twister['normalized'])
+                time_seconds = time.monotonic() - session.attempt_started_at
+                score = calculate_score(accuracy, time_seconds, twister['difficulty'])
+                is_successful = accuracy >= _SUCCESS_THRESHOLD
+                
+                cumulative_score += score
+                session.total_score += score
+                session.attempts += 1
+                if is_successful:
+                    session.successful_attempts += 1
+                
+                # Save result
+                results.append({
+                    'text': twister['text'],
+                    'accuracy': accuracy,
+                    'time': time_seconds,
+                    'score': score,
+                    'difficulty': twister['difficulty']
+                })
+                
+                # Queue for the database; written in one batch once the challenge ends
+                pending_attempts.append({
+                    'user_id': str(interaction.user.id),
+                    'twister_id': twister['id'],
+                    'spoken_text': spoken_text,
+                    'accuracy': accuracy,
+                    'time_seconds': time_seconds,
+                    'score': score,
+                    'difficulty': twister['difficulty'],
+                    'session_type': 'challenge',
+                    'is_successful': is_successful
+                })
+                
+                session.twisters_completed += 1
+        finally:
+            # Write queued attempts even if the round loop ends on an error
+            await db_manager.save_attempts(pending_attempts)
         
         # Challenge complete
         avg_accuracy = sum(r['accuracy'] for r in results) / len(results) if results else 0
         
         # Check if personal best
         player_stats = await db_manager.get_player_stats(str(interaction.user.id))
-        is_pb = player_stats and cumulative_score > (player_stats.get('best_score', 0) or 0)
+        is_pb = player_stats and cumulative_score > (player_stats.best_score or 0)
         
         # Get server rank
         rank = await db_manager.get_player_rank(
@@ -596,34 +562,34 @@ class GameCommands(commands.Cog):
         )
         
         # Overall performance
-        success_rate = (stats['successful_attempts'] / stats['total_attempts'] * 100) if stats['total_attempts'] > 0 else 0
-        avg_score = stats['total_score'] / stats['total_attempts'] if stats['total_attempts'] > 0 else 0
+        success_rate = (stats.successful_attempts / stats.total_attempts * 100) if stats.total_attempts > 0 else 0
+        avg_score = stats.total_score / stats.total_attempts if stats.total_attempts > 0 else 0
         
         embed.add_field(
             name="Overall Performance",
             value=(
-                f"**Total Attempts:** {stats['total_attempts']}\n"
-                f"**Success Rate:** {success_rate:.1f}% ({stats['successful_attempts']}/{stats['total_attempts']})\n"
-                f"**Total Score:** {stats['total_score']:,} points\n"
+                f"**Total Attempts:** {stats.total_attempts}\n"
+                f"**Success Rate:** {success_rate:.1f}% ({stats.successful_attempts}/{stats.total_attempts})\n"
+                f"**Total Score:** {stats.total_score:,} points\n"
                 f"**Average Score:** {avg_score:.0f} points per attempt"
             ),
             inline=False
         )
         
         # Personal bests
-        fastest = f"{stats['fastest_time']:.1f}s" if stats['fastest_time'] else "N/A"
+        fastest = f"{stats.fastest_time:.1f}s" if stats.fastest_time else "N/A"
         embed.add_field(
             name="Personal Bests",
             value=(
-                f"**Highest Score:** {stats['best_score']:,} points\n"
+                f"**Highest Score:** {stats.best_score:,} points\n"
                 f"**Fastest Time:** {fastest}\n"
-                f"**Best Twister ID:** #{stats['best_score_twister_id'] or 'N/A'}"
+                f"**Best Twister ID:** #{stats.best_score_twister_id or 'N/A'}"
             ),
             inline=False
         )
         
         # By difficulty
-        difficulty_stats = stats.get('difficulty_stats', {})
+        difficulty_stats = stats.difficulty_stats
         if difficulty_stats:
             diff_text = ""
             for diff in ['easy', 'medium', 'hard', 'insane']:
@@ -642,7 +608,7 @@ class GameCommands(commands.Cog):
                     inline=False
                 )
         
-        embed.set_footer(text=f"Last played: {stats.get('last_played', 'Never')}")
+        embed.set_footer(text=f"Last played: {stats.last_played or 'Never'}")
         
         await interaction.response.send_message(embed=embed)
     
@@ -822,76 +788,92 @@ class GameCommands(commands.Cog):
         challenger_wins = 0
         opponent_wins = 0
         rounds_to_win = config.DUEL_BEST_OF // 2 + 1
+        pending_attempts = []
         
-        for round_num in range(1, config.DUEL_BEST_OF + 1):
-            if challenger_wins >= rounds_to_win or opponent_wins >= rounds_to_win:
-                break
-            
-            # Get random twister (increasing difficulty)
-            if round_num <= 2:
-                difficulty = 'easy'
-            elif round_num <= 4:
-                difficulty = 'medium'
-            else:
-                difficulty = 'hard'
-            
-            twister = get_random_twister(difficulty)
-            
-            await interaction.followup.send(
-                f"⚔️ **ROUND {round_num}/{config.DUEL_BEST_OF}** ⚔️\n\n"
-                f"Both players will say:\n"
-                f"**\"{twister['text']}\"**\n\n"
-                f"{challenger.mention}, you're up first!\n"
-                f"I'm listening...",
-                ephemeral=False
-            )
-            
-            # Challenger's turn
-            challenger_score = await self._process_player_attempt(
-                interaction, voice_client, challenger, twister, round_num
-            )
-            
-            if challenger_score is None:
-                await interaction.followup.send("❌ Challenger's attempt failed. Skipping round...")
-                continue
-            
-            await interaction.followup.send(
-                f"{challenger.mention}: **{challenger_score['score']:,} points** "
-                f"({challenger_score['accuracy']:.1f}% accuracy, {challenger_score['time']:.1f}s)"
-            )
-            
-            await interaction.followup.send(f"Now {interaction.user.mention}'s turn!\nI'm listening...")
-            
-            # Opponent's turn
-            opponent_score = await self._process_player_attempt(
-                interaction, voice_client, interaction.user, twister, round_num
-            )
-            
-            if opponent_score is None:
-                await interaction.followup.send("❌ Opponent's attempt failed. Skipping round...")
-                continue
-            
-            await interaction.followup.send(
-                f"{interaction.user.mention}: **{opponent_score['score']:,} points** "
-                f"({opponent_score['accuracy']:.1f}% accuracy, {opponent_score['time']:.1f}s)"
-            )
-            
-            # Determine round winner
-            if challenger_score['score'] > opponent_score['score']:
-                challenger_wins += 1
-                winner = challenger.mention
-            elif opponent_score['score'] > challenger_score['score']:
-                opponent_wins += 1
-                winner = interaction.user.mention
-            else:
-                winner = "Tie"
-            
-            await interaction.followup.send(
-                f"🎉 {winner} wins Round {round_num}!\n\n"
-                f"Score: {challenger.mention}: {challenger_wins} | {interaction.user.mention}: {opponent_wins}"
-            )
-            
-            await asyncio.sleep(2)
+        # Draw every round's twister up front (increasing difficulty: 2 easy, 2 medium, rest hard)
+        round_twisters = (
+            get_random_twisters(min(config.DUEL_BEST_OF, 2), 'easy')
+            + get_random_twisters(max(0, min(config.DUEL_BEST_OF, 4) - 2), 'medium')
+            + get_random_twisters(max(0, config.DUEL_BEST_OF - 4), 'hard')
+        )
+        
+        try:
+            for round_num, twister in enumerate(round_twisters, 1):
+                if challenger_wins >= rounds_to_win or opponent_wins >= rounds_to_win:
+                    break
+                
+                # One message per round, edited in place as the round progresses
+                round_embed = discord.Embed(
+                    title=f"⚔️ ROUND {round_num}/{config.DUEL_BEST_OF} ⚔️",
+                    description=f"Both players will say:\n**\"{twister['text']}\"**",
+                    color=discord.Color.orange()
+                )
+                round_embed.add_field(
+                    name="Status",
+                    value=f"{challenger.mention}, you're up first!\nI'm listening...",
+                    inline=False
+                )
+                round_message = await interaction.followup.send(embed=round_embed, wait=True)
+                
+                # Challenger's turn
+                challenger_score = await self._process_player_attempt(
+                    interaction, voice_client, challenger, twister, round_num, pending_attempts
+                )
+                
+                if challenger_score is None:
+                    round_embed.set_field_at(0, name="Status", value="❌ Challenger's attempt failed. Skipping round...", inline=False)
+                    await round_message.edit(embed=round_embed)
+                    continue
+                
+                round_embed.add_field(
+                    name=challenger.display_name,
+                    value=f"**{challenger_score['score']:,} points** "
+                          f"({challenger_score['accuracy']:.1f}% accuracy, {challenger_score['time']:.1f}s)",
+                    inline=True
+                )
+                round_embed.set_field_at(0, name="Status", value=f"Now {interaction.user.mention}'s turn!\nI'm listening...", inline=False)
+                await round_message.edit(embed=round_embed)
+                
+                # Opponent's turn
+                opponent_score = await self._process_player_attempt(
+                    interaction, voice_client, interaction.user, twister, round_num, pending_attempts
+                )
+                
+                if opponent_score is None:
+                    round_embed.set_field_at(0, name="Status", value="❌ Opponent's attempt failed. Skipping round...", inline=False)
+                    await round_message.edit(embed=round_embed)
+                    continue
+                
+                round_embed.add_field(
+                    name=interaction.user.display_name,
+                    value=f"**{opponent_score['score']:,} points** "
+                          f"({opponent_score['accuracy']:.1f}% accuracy, {opponent_score['time']:.1f}s)",
+                    inline=True
+                )
+                
+                # Determine round winner
+                if challenger_score['score'] > opponent_score['score']:
+                    challenger_wins += 1
+                    winner = challenger.mention
+                elif opponent_score['score'] > challenger_score['score']:
+                    opponent_wins += 1
+                    winner = interaction.user.mention
+                else:
+                    winner = "Tie"
+                
+                round_embed.set_field_at(
+                    0,
+                    name="Status",
+                    value=f"🎉 {winner} wins Round {round_num}!\n\n"
+                          f"Score: {challenger.mention}: {challenger_wins} | {interaction.user.mention}: {opponent_wins}",
+                    inline=False
+                )
+                await round_message.edit(embed=round_embed)
+                
+                await asyncio.sleep(2)
+        finally:
+            # Write queued attempts even if the round loop ends on an error
+            await db_manager.save_attempts(pending_attempts)
         
         # Determine match winner
         if challenger_wins > opponent_wins:
@@ -926,14 +908,15 @@ class GameCommands(commands.Cog):
         voice_client: discord.VoiceClient,
         player: discord.Member,
         twister: dict,
-        round_num: int
+        round_num: int,
+        pending_attempts: List[Dict]
     ) -> Optional[Dict]:
-        """Process a player's attempt in a duel."""
+        """Process a player's attempt in a duel, queueing it on pending_attempts."""
         # Record audio
-        recorder = AudioRecorder(voice_client)
-        audio_file = await recorder.record_user_audio(player.id, config.VOICE_RECORDING_TIMEOUT)
+        recorder = self.voice_handler.get_recorder(voice_client)
+        recording = await recorder.record_user_audio(player.id, config.VOICE_RECORDING_TIMEOUT)
         
-        if not audio_file:
+        if not recording:
             return None
         
         # Transcribe
@@ -941,45 +924,38 @@ class GameCommands(commands.Cog):
         if not whisper:
             return None
         
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         # Pass the target text as initial prompt to help Whisper transcribe correctly
-        spoken_text = await whisper.transcribe(audio_file, initial_prompt=twister['text'])
+        transcribe_task = asyncio.create_task(
+            whisper.transcribe(recording, initial_prompt=twister['text'])
+        )
+        
+        # Warm up the player record while Whisper is busy
+        spoken_text, _ = await asyncio.gather(
+            transcribe_task,
+            db_manager.get_or_create_player(str(player.id), player.display_name)
+        )
         
         if not spoken_text:
             return None
         
         # Calculate score
-        accuracy = calculate_accuracy(spoken_text, twister['text'])
-        time_seconds = (datetime.utcnow() - start_time).total_seconds()
+        accuracy = calculate_accuracy(spoken_text, twister['text'], twister['normalized'])
+        time_seconds = time.monotonic() - start_time
         score = calculate_score(accuracy, time_seconds, twister['difficulty'])
         
-        # Save to database
-        await db_manager.get_or_create_player(str(player.id), player.display_name)
-        await db_manager.save_attempt(
-            str(player.id),
-            twister['id'],
-            spoken_text,
-            accuracy,
-            time_seconds,
-            score,
-            twister['difficulty'],
-            'duel',
-            None
-        )
-        await db_manager.update_player_stats(
-            str(player.id),
-            accuracy,
-            time_seconds,
-            score,
-            twister['id'],
-            is_successful_attempt(accuracy)
-        )
-        
-        # Cleanup
-        try:
-            os.remove(audio_file)
-        except:
-            pass
+        # Queue for the database; the duel writes all rounds in one batch
+        pending_attempts.append({
+            'user_id': str(player.id),
+            'twister_id': twister['id'],
+            'spoken_text': spoken_text,
+            'accuracy': accuracy,
+            'time_seconds': time_seconds,
+            'score': score,
+            'difficulty': twister['difficulty'],
+            'session_type': 'duel',
+            'is_successful': accuracy >= _SUCCESS_THRESHOLD
+        })
         
         return {
             'score': score,
@@ -1025,34 +1001,8 @@ class GameCommands(commands.Cog):
             else:
                 difficulty = 'insane'
         
-        # Get next custom twister ID (start from 1000)
-        db_path = os.getenv("DATABASE_PATH", "./data/twister.db")
-        
-        async with aiosqlite.connect(db_path) as db:
-            async with db.execute(
-                "SELECT MAX(twister_id) FROM tongue_twisters WHERE twister_id >= 1000"
-            ) as cursor:
-                row = await cursor.fetchone()
-                next_id = (row[0] or 999) + 1
-            
-            # Insert custom twister
-            await db.execute(
-                """
-                INSERT INTO tongue_twisters 
-                (twister_id, text, difficulty, word_count, focus_sounds, created_by, is_official)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    next_id,
-                    text,
-                    difficulty,
-                    len(text.split()),
-                    "Custom",
-                    str(interaction.user.id),
-                    False
-                )
-            )
-            await db.commit()
+        # Custom twister IDs start from 1000
+        next_id = await db_manager.add_custom_twister(text, difficulty, str(interaction.user.id))
         
         embed = discord.Embed(
             title="✅ Custom Tongue Twister Added!",
@@ -1069,26 +1019,7 @@ class GameCommands(commands.Cog):
     @app_commands.command(name="twister_custom_list", description="View custom tongue twisters")
     async def custom_list(self, interaction: discord.Interaction):
         """View custom tongue twisters."""
-        db_path = os.getenv("DATABASE_PATH", "./data/twister.db")
-        
-        async with aiosqlite.connect(db_path) as db:
-            async with db.execute(
-                """
-                SELECT twister_id, text, difficulty, created_by
-                FROM tongue_twisters
-                WHERE is_official = FALSE
-                ORDER BY twister_id DESC
-                LIMIT 20
-                """
-            ) as cursor:
-                twisters = []
-                async for row in cursor:
-                    twisters.append({
-                        'id': row[0],
-                        'text': row[1],
-                        'difficulty': row[2],
-                        'created_by': row[3]
-                    })
+        twisters = await db_manager.get_custom_twisters(limit=20)
         
         if not twisters:
             await interaction.response.send_message("❌ No custom tongue twisters found!", ephemeral=True)
@@ -1127,45 +1058,20 @@ class GameCommands(commands.Cog):
             return
         
         # Get or create today's daily challenge
-        db_path = os.getenv("DATABASE_PATH", "./data/twister.db")
         today = date.today()
+        daily_twister = await db_manager.get_or_create_daily_challenge(today)
+        if not daily_twister:
+            await interaction.response.send_message("❌ Daily challenge twister not found!", ephemeral=True)
+            return
         
-        async with aiosqlite.connect(db_path) as db:
-            # Check if daily challenge exists
-            async with db.execute(
-                "SELECT twister_id FROM daily_challenges WHERE challenge_date = ?",
-                (today,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                if row:
-                    twister_id = row[0]
-                else:
-                    # Create new daily challenge with random twister
-                    twister = get_random_twister()
-                    twister_id = twister['id']
-                    await db.execute(
-                        "INSERT INTO daily_challenges (challenge_date, twister_id) VALUES (?, ?)",
-                        (today, twister_id)
-                    )
-                    await db.commit()
-            
-            # Get twister
-            async with db.execute(
-                "SELECT text, difficulty FROM tongue_twisters WHERE twister_id = ?",
-                (twister_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                if not row:
-                    await interaction.response.send_message("❌ Daily challenge twister not found!", ephemeral=True)
-                    return
-                
-                twister_text = row[0]
-                twister_difficulty = row[1]
+        twister_id = daily_twister['id']
+        twister_text = daily_twister['text']
+        twister_difficulty = daily_twister['difficulty']
         
         # Update session
         session.current_twister_id = twister_id
         session.waiting_for_attempt = True
-        session.attempt_started_at = datetime.utcnow()
+        session.attempt_started_at = time.monotonic()
         session.mode = 'daily'
         
         embed = discord.Embed(
@@ -1199,10 +1105,10 @@ class GameCommands(commands.Cog):
             return
         
         # Record audio
-        recorder = AudioRecorder(voice_client)
-        audio_file = await recorder.record_user_audio(interaction.user.id, config.VOICE_RECORDING_TIMEOUT)
+        recorder = self.voice_handler.get_recorder(voice_client)
+        recording = await recorder.record_user_audio(interaction.user.id, config.VOICE_RECORDING_TIMEOUT)
         
-        if not audio_file:
+        if not recording:
             await interaction.followup.send("❌ Failed to record audio. Make sure your microphone is working!", ephemeral=True)
             session.waiting_for_attempt = False
             return
@@ -1217,21 +1123,19 @@ class GameCommands(commands.Cog):
         await interaction.followup.send("🎤 Processing your speech...", ephemeral=True)
         
         # Pass the target text as initial prompt to help Whisper transcribe correctly
-        spoken_text = await whisper.transcribe(audio_file, initial_prompt=twister_text)
+        spoken_text = await whisper.transcribe(recording, initial_prompt=twister_text)
         
         if not spoken_text:
             await interaction.followup.send("❌ Could not understand your speech. Try speaking more clearly!", ephemeral=True)
             session.waiting_for_attempt = False
             return
         
-        # Calculate accuracy and score
-        accuracy = calculate_accuracy(spoken_text, twister_text)
-        time_seconds = (datetime.utcnow() - session.attempt_started_at).total_seconds()
+        # Calculate accuracy, mistakes and score
+        target_normalized = get_normalized_text(twister_id, twister_text)
+        accuracy, mistakes = score_attempt(spoken_text, twister_text, target_normalized)
+        time_seconds = time.monotonic() - session.attempt_started_at
         score = calculate_score(accuracy, time_seconds, twister_difficulty)
-        is_successful = is_successful_attempt(accuracy)
-        
-        # Find mistakes
-        mistakes = find_differences(spoken_text, twister_text)
+        is_successful = accuracy >= _SUCCESS_THRESHOLD
         
         # Update session
         session.attempts += 1
@@ -1242,7 +1146,7 @@ class GameCommands(commands.Cog):
         
         # Save to database
         await db_manager.get_or_create_player(str(interaction.user.id), interaction.user.display_name)
-        attempt_id = await db_manager.save_attempt(
+        attempt_id = await db_manager.record_attempt(
             str(interaction.user.id),
             twister_id,
             spoken_text,
@@ -1251,45 +1155,22 @@ class GameCommands(commands.Cog):
             score,
             twister_difficulty,
             'daily',
+            is_successful,
             session.session_id
         )
-        await db_manager.update_player_stats(
+        
+        # Save daily challenge attempt
+        await db_manager.save_daily_attempt(
+            attempt_id,
+            today,
             str(interaction.user.id),
-            accuracy,
-            time_seconds,
             score,
-            twister_id,
-            is_successful
+            accuracy,
+            time_seconds
         )
         
-        # Save daily challenge attempt
-        db_path = os.getenv("DATABASE_PATH", "./data/twister.db")
-        
-        async with aiosqlite.connect(db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO daily_challenge_attempts 
-                (attempt_id, challenge_date, user_id, score, accuracy, time_seconds)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (attempt_id, today, str(interaction.user.id), score, accuracy, time_seconds)
-            )
-            await db.commit()
-        
         # Get daily leaderboard rank
-        db_path = os.getenv("DATABASE_PATH", "./data/twister.db")
-        
-        async with aiosqlite.connect(db_path) as db:
-            async with db.execute(
-                """
-                SELECT COUNT(*) + 1
-                FROM daily_challenge_attempts
-                WHERE challenge_date = ? AND score > ?
-                """,
-                (today, score)
-            ) as cursor:
-                row = await cursor.fetchone()
-                daily_rank = row[0] if row else 1
+        daily_rank = await db_manager.get_daily_rank(today, score)
         
         # Send results
         embed = create_results_embed(
@@ -1303,14 +1184,6 @@ class GameCommands(commands.Cog):
         )
         embed.set_footer(text=f"Daily Challenge Rank: #{daily_rank} | Try again tomorrow for a new challenge!")
         await interaction.followup.send(embed=embed)
-        
-        # Cleanup audio file (wait a bit to ensure transcription is done)
-        try:
-            await asyncio.sleep(0.5)  # Small delay to ensure file operations are complete
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-        except Exception as e:
-            print(f"[WARNING] Could not delete audio file {audio_file}: {e}")
 
 
 async def setup(bot: commands.Bot):
@@ -44,34 +44,34 @@ class StatsCommands(commands.Cog):
         )
         
         # Overall performance
-        success_rate = (stats['successful_attempts'] / stats['total_attempts'] * 100) if stats['total_attempts'] > 0 else 0
-        avg_score = stats['total_score'] / stats['total_attempts'] if stats['total_attempts'] > 0 else 0
+        success_rate = (stats.successful_attempts / stats.total_attempts * 100) if stats.total_attempts > 0 else 0
+        avg_score = stats.total_score / stats.total_attempts if stats.total_attempts > 0 else 0
         
         embed.add_field(
             name="Overall Performance",
             value=(
-                f"**Total Attempts:** {stats['total_attempts']}\n"
-                f"**Success Rate:** {success_rate:.1f}% ({stats['successful_attempts']}/{stats['total_attempts']})\n"
-                f"**Total Score:** {stats['total_score']:,} points\n"
+                f"**Total Attempts:** {stats.total_attempts}\n"
+                f"**Success Rate:** {success_rate:.1f}% ({stats.successful_attempts}/{stats.total_attempts})\n"
+                f"**Total Score:** {stats.total_score:,} points\n"
                 f"**Average Score:** {avg_score:.0f} points per attempt"
             ),
             inline=False
         )
         
         # Personal bests
-        fastest = f"{stats['fastest_time']:.1f}s" if stats['fastest_time'] else "N/A"
+        fastest = f"{stats.fastest_time:.1f}s" if stats.fastest_time else "N/A"
         embed.add_field(
             name="Personal Bests",
             value=(
-                f"**Highest Score:** {stats['best_score']:,} points\n"
+                f"**Highest Score:** {stats.best_score:,} points\n"
                 f"**Fastest Time:** {fastest}\n"
-                f"**Best Twister ID:** #{stats['best_score_twister_id'] or 'N/A'}"
+                f"**Best Twister ID:** #{stats.best_score_twister_id or 'N/A'}"
             ),
             inline=False
         )
         
         # By difficulty
-        difficulty_stats = stats.get('difficulty_stats', {})
+        difficulty_stats = stats.difficulty_stats
         if difficulty_stats:
             diff_text = ""
             for diff in ['easy', 'medium', 'hard', 'insane']:
@@ -90,7 +90,7 @@ class StatsCommands(commands.Cog):
                     inline=False
                 )
         
-        embed.set_footer(text=f"Last played: {stats.get('last_played', 'Never')}")
+        embed.set_footer(text=f"Last played: {stats.last_played or 'Never'}")
         
         await ctx.respond(embed=embed)
     
@@ -31,6 +31,9 @@ VOICE_MIN_RECORDING_TIME = 0.5  # Minimum recording time before silence detectio
 VOICE_ACTIVITY_THRESHOLD = 0.08  # Audio level above this is considered speech (for VAD) - increased to avoid false positives
 VOICE_PREBUFFER_SIZE = 5  # Number of chunks to keep before speech detection (reduced to avoid capturing pre-speech audio)
 VOICE_VAD_CONFIRMATION_CHUNKS = 3  # Number of consecutive chunks with speech required before starting recording
+VOICE_SAVE_RECORDINGS = False  # Also write each recording to data/audio as a WAV (recordings are transcribed from memory)
+VOICE_DEBUG_LOGGING = False  # Print per-packet [DEBUG] output from the Discord audio sink
+STT_DEBUG_LOGGING = False  # Print per-transcription [DEBUG] output from Whisper speech-to-text
 
 # Duel settings
 DUEL_TIMEOUT = 120  # seconds to accept duel
@@ -1,7 +1,9 @@
 """Tongue twister library with 20 starter twisters."""
 
 from typing import List, Dict, Optional
+from functools import lru_cache
 import random
+from utils.text_similarity import normalize_text, get_target_words
 
 # All 20 tongue twisters
 TWISTERS = [
@@ -151,6 +153,21 @@ TWISTERS = [
     },
 ]
 
+# Normalize and split each twister's text once at import so scoring doesn't redo it
+# per attempt (this also warms the text_similarity caches with every library twister)
+for _twister in TWISTERS:
+    _twister['normalized'] = normalize_text(_twister['text'])
+    get_target_words(_twister['normalized'])
+
+# Twisters grouped by difficulty, built once so lookups don't rescan the library
+_BY_DIFFICULTY: Dict[str, tuple] = {}
+for _twister in TWISTERS:
+    _difficulty = _twister['difficulty'].lower()
+    _BY_DIFFICULTY[_difficulty] = _BY_DIFFICULTY.get(_difficulty, ()) + (_twister,)
+
+# Dedicated RNG for twister selection
+_rng = random.Random()
+
 
 def get_twister_by_id(twister_id: int) -> Optional[Dict]:
     """Get a tongue twister by its ID."""
@@ -162,20 +179,30 @@ def get_twister_by_id(twister_id: int) -> Optional[Dict]:
 
 def get_twisters_by_difficulty(difficulty: str) -> List[Dict]:
     """Get all tongue twisters of a specific difficulty."""
-    return [t for t in TWISTERS if t['difficulty'].lower() == difficulty.lower()]
+    return list(_BY_DIFFICULTY.get(difficulty.lower(), ()))
 
 
 def get_random_twister(difficulty: Optional[str] = None) -> Dict:
     """Get a random tongue twister, optionally filtered by difficulty."""
     if difficulty:
-        twisters = get_twisters_by_difficulty(difficulty)
-        if not twisters:
-            # Fallback to all twisters if difficulty not found
-            twisters = TWISTERS
-    else:
-        twisters = TWISTERS
+        # Fallback to all twisters if difficulty not found
+        return _rng.choice(_BY_DIFFICULTY.get(difficulty.lower(), TWISTERS))
     
-    return random.choice(twisters)
+    return _rng.choice(TWISTERS)
+
+
+def get_random_twisters(count: int, difficulty: Optional[str] = None) -> List[Dict]:
+    """Get several random tongue twisters in a single draw, optionally filtered by difficulty."""
+    if difficulty:
+        return _rng.choices(_BY_DIFFICULTY.get(difficulty.lower(), TWISTERS), k=count)
+    
+    return _rng.choices(TWISTERS, k=count)
+
+
+@lru_cache(maxsize=256)
+def get_normalized_text(twister_id: int, text: str) -> str:
+    """Get the normalized text of a twister, cached by ID (for twisters loaded from the database)."""
+    return normalize_text(text)
 
 
 def get_all_twisters() -> List[Dict]:
@@ -1,161 +1,210 @@
 """Database operations manager."""
 
 import aiosqlite
+import asyncio
 import os
-import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Optional, List, Dict
 from datetime import datetime, date
 from dotenv import load_dotenv
+from data.tongue_twisters import get_random_twister
+from database.models import PlayerRecord
+from game.uuid_pool import uuid_pool
 
 load_dotenv()
 
+# Applied to every connection: WAL lets readers run during writes and
+# synchronous=NORMAL drops the per-commit fsync for these single-row writes
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+"""
+
+# Restricts players (aliased p) to those with a session on the bound server_id
+SERVER_SCOPE_JOIN = "INNER JOIN (SELECT DISTINCT user_id FROM sessions WHERE server_id = ?) s ON s.user_id = p.user_id"
+
+# Hot statements, shared by every method that runs them so each is parsed
+# once into the connection's statement cache
+# Column order here must match the PlayerRecord field order
+PLAYER_COLS = (
+    "user_id, username, total_attempts, successful_attempts, total_score, "
+    "best_score, best_score_twister_id, fastest_time, created_at, last_played"
+)
+
+SELECT_PLAYER_SQL = f"SELECT {PLAYER_COLS} FROM players WHERE user_id = ?"
+
+INSERT_ATTEMPT_SQL = """
+INSERT INTO attempts
+(attempt_id, user_id, twister_id, spoken_text, accuracy,
+ time_seconds, score, difficulty, session_type)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Running average; SET sees the pre-update column values
+UPDATE_TWISTER_STATS_SQL = """
+UPDATE tongue_twisters
+SET average_accuracy = (average_accuracy * times_attempted + ?) / (times_attempted + 1),
+    times_attempted = times_attempted + 1
+WHERE twister_id = ?
+"""
+
+# best_score_twister_id follows best_score in the same statement
+UPDATE_PLAYER_STATS_SQL = """
+UPDATE players
+SET total_attempts = total_attempts + 1,
+    successful_attempts = successful_attempts + ?,
+    total_score = total_score + ?,
+    best_score_twister_id = CASE
+        WHEN ? >= best_score THEN ?
+        ELSE best_score_twister_id
+    END,
+    best_score = MAX(best_score, ?),
+    fastest_time = CASE
+        WHEN fastest_time IS NULL OR ? < fastest_time THEN ?
+        ELSE fastest_time
+    END,
+    last_played = ?
+WHERE user_id = ?
+"""
+
+# Applied to the read-only connection (journal mode and sync are the writer's concern)
+READ_CONNECTION_PRAGMAS = """
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+"""
+
+# Size of sqlite3's per-connection prepared statement cache (default is 128)
+STATEMENT_CACHE_SIZE = 256
+
 
 class DatabaseManager:
     """Manages all database operations."""
     
     def __init__(self):
         self.db_path = os.getenv("DATABASE_PATH", "./data/twister.db")
+        self._rw: Optional[aiosqlite.Connection] = None  # Writer, shared by all write operations
+        self._ro: Optional[aiosqlite.Connection] = None  # Read-only, for SELECT-only operations
+        self._write_lock = asyncio.Lock()  # Keeps one operation's statements/commit together on the writer
+    
+    async def connect(self):
+        """Open the long-lived writer and read-only connections."""
+        if self._rw is not None:
+            return
+        
+        # Writer first: it switches the file to WAL, which lets the reader run during writes
+        self._rw = await aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+        await self._rw.executescript(CONNECTION_PRAGMAS)
+        
+        read_uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        self._ro = await aiosqlite.connect(read_uri, uri=True, cached_statements=STATEMENT_CACHE_SIZE)
+        await self._ro.executescript(READ_CONNECTION_PRAGMAS)
+    
+    async def close(self):
+        """Close the long-lived connections."""
+        if self._ro is not None:
+            await self._ro.close()
+            self._ro = None
+        
+        if self._rw is not None:
+            # Refresh planner statistics that this connection's queries found stale
+            await self._rw.execute("PRAGMA optimize")
+            await self._rw.close()
+            self._rw = None
+    
+    @asynccontextmanager
+    async def _get_connection(self):
+        """Get database connection context manager for operations that write.
+        
+        Uses the long-lived writer once connect() has been called,
+        otherwise opens a one-off connection.
+        """
+        if self._rw is None:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.executescript(CONNECTION_PRAGMAS)
+                yield db
+            return
+        
+        async with self._write_lock:
+            try:
+                yield self._rw
+            except Exception:
+                # Don't leave a half-done write pending for the next caller's commit
+                await self._rw.rollback()
+                raise
     
-    def _get_connection(self):
-        """Get database connection context manager."""
-        return aiosqlite.connect(self.db_path)
+    @asynccontextmanager
+    async def _get_read_connection(self):
+        """Get database connection context manager for SELECT-only operations.
+        
+        Uses the read-only connection, which never waits on the write lock.
+        """
+        if self._ro is None:
+            async with self._get_connection() as db:
+                yield db
+            return
+        
+        yield self._ro
     
     # Player operations
-    async def get_or_create_player(self, user_id: str, username: str) -> Dict:
+    async def get_or_create_player(self, user_id: str, username: str) -> PlayerRecord:
         """Get or create a player record."""
         async with self._get_connection() as db:
             # Try to get existing player
-            async with db.execute(
-                "SELECT * FROM players WHERE user_id = ?",
-                (user_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                if row:
-                    return {
-                        'user_id': row[0],
-                        'username': row[1],
-                        'total_attempts': row[2],
-                        'successful_attempts': row[3],
-                        'total_score': row[4],
-                        'best_score': row[5],
-                        'best_score_twister_id': row[6],
-                        'fastest_time': row[7],
-                        'created_at': row[8],
-                        'last_played': row[9],
-                    }
+            rows = await db.execute_fetchall(SELECT_PLAYER_SQL, (user_id,))
+            if rows:
+                return PlayerRecord(*rows[0])
             
             # Create new player
+            now = datetime.utcnow()
             await db.execute(
                 """
-                INSERT INTO players (user_id, username, last_played)
-                VALUES (?, ?, ?)
+                INSERT INTO players (user_id, username, created_at, last_played)
+                VALUES (?, ?, ?, ?)
                 """,
-                (user_id, username, datetime.utcnow())
+                (user_id, username, now, now)
             )
             await db.commit()
             
-            # Return new player
-            return await self.get_or_create_player(user_id, username)
+            # Return new player (remaining columns take their table defaults)
+            return PlayerRecord(user_id, username, created_at=now, last_played=now)
     
-    async def update_player_stats(
-        self,
-        user_id: str,
-        accuracy: float,
-        time_seconds: float,
-        score: int,
-        twister_id: int,
-        is_successful: bool
-    ):
-        """Update player statistics after an attempt."""
-        async with self._get_connection() as db:
-            # Update player stats
-            await db.execute(
-                """
-                UPDATE players
-                SET total_attempts = total_attempts + 1,
-                    successful_attempts = successful_attempts + ?,
-                    total_score = total_score + ?,
-                    best_score = MAX(best_score, ?),
-                    fastest_time = CASE
-                        WHEN fastest_time IS NULL OR ? < fastest_time THEN ?
-                        ELSE fastest_time
-                    END,
-                    last_played = ?
-                WHERE user_id = ?
-                """,
-                (
-                    1 if is_successful else 0,
-                    score,
-                    score,
-                    time_seconds,
-                    time_seconds,
-                    datetime.utcnow(),
-                    user_id
-                )
-            )
-            
-            # Update best_score_twister_id if this is a new best
-            await db.execute(
-                """
-                UPDATE players
-                SET best_score_twister_id = ?
-                WHERE user_id = ? AND best_score = ?
-                """,
-                (twister_id, user_id, score)
-            )
-            
-            await db.commit()
-    
-    async def get_player_stats(self, user_id: str) -> Optional[Dict]:
+    async def get_player_stats(self, user_id: str) -> Optional[PlayerRecord]:
         """Get comprehensive player statistics."""
-        async with self._get_connection() as db:
-            async with db.execute(
+        async with self._get_read_connection() as db:
+            rows = await db.execute_fetchall(SELECT_PLAYER_SQL, (user_id,))
+            if not rows:
+                return None
+            
+            # Get attempts by difficulty
+            difficulty_rows = await db.execute_fetchall(
                 """
-                SELECT * FROM players WHERE user_id = ?
+                SELECT difficulty, 
+                       COUNT(*) as attempts,
+                       AVG(accuracy) as avg_accuracy,
+                       MAX(score) as best_score
+                FROM attempts
+                WHERE user_id = ?
+                GROUP BY difficulty
                 """,
                 (user_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                if not row:
-                    return None
-                
-                # Get attempts by difficulty
-                async with db.execute(
-                    """
-                    SELECT difficulty, 
-                           COUNT(*) as attempts,
-                           AVG(accuracy) as avg_accuracy,
-                           MAX(score) as best_score
-                    FROM attempts
-                    WHERE user_id = ?
-                    GROUP BY difficulty
-                    """,
-                    (user_id,)
-                ) as cursor2:
-                    difficulty_stats = {}
-                    async for row2 in cursor2:
-                        difficulty_stats[row2[0]] = {
-                            'attempts': row2[1],
-                            'avg_accuracy': row2[2] or 0.0,
-                            'best_score': row2[3] or 0
-                        }
-                
-                return {
-                    'user_id': row[0],
-                    'username': row[1],
-                    'total_attempts': row[2],
-                    'successful_attempts': row[3],
-                    'total_score': row[4],
-                    'best_score': row[5],
-                    'best_score_twister_id': row[6],
-                    'fastest_time': row[7],
-                    'created_at': row[8],
-                    'last_played': row[9],
-                    'difficulty_stats': difficulty_stats
+            )
+            difficulty_stats = {}
+            for row in difficulty_rows:
+                difficulty_stats[row[0]] = {
+                    'attempts': row[1],
+                    'avg_accuracy': row[2] or 0.0,
+                    'best_score': row[3] or 0
                 }
+            
+            return PlayerRecord(*rows[0], difficulty_stats=difficulty_stats)
     
     # Attempt operations
-    async def save_attempt(
+    async def record_attempt(
         self,
         user_id: str,
         twister_id: int,
@@ -165,43 +214,76 @@ class DatabaseManager:
         score: int,
         difficulty: str,
         session_type: str,
-        session_id: Optional[str] = None
+        is_successful: bool,
+        session_id: Optional[str] = None,
+        now: Optional[datetime] = None
     ) -> str:
-        """Save an attempt to the database."""
-        attempt_id = str(uuid.uuid4())
+        """Save an attempt and update player/twister stats in a single transaction."""
+        attempt_ids = await self.save_attempts([{
+            'user_id': user_id,
+            'twister_id': twister_id,
+            'spoken_text': spoken_text,
+            'accuracy': accuracy,
+            'time_seconds': time_seconds,
+            'score': score,
+            'difficulty': difficulty,
+            'session_type': session_type,
+            'is_successful': is_successful
+        }], now)
+        return attempt_ids[0]
+    
+    async def save_attempts(self, attempts: List[Dict], now: Optional[datetime] = None) -> List[str]:
+        """Save a batch of attempts and their player/twister stat updates in one transaction.
+        
+        Each attempt dict holds the record_attempt arguments except session_id and now.
+        """
+        if not attempts:
+            return []
+        
+        attempt_ids = [uuid_pool.get() for _ in attempts]
+        now = now or datetime.utcnow()
         
         async with self._get_connection() as db:
-            await db.execute(
-                """
-                INSERT INTO attempts 
-                (attempt_id, user_id, twister_id, spoken_text, accuracy, 
-                 time_seconds, score, difficulty, session_type)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    attempt_id, user_id, twister_id, spoken_text,
-                    accuracy, time_seconds, score, difficulty, session_type
-                )
+            await db.execute("BEGIN IMMEDIATE")
+            await db.executemany(
+                INSERT_ATTEMPT_SQL,
+                [
+                    (
+                        attempt_id, a['user_id'], a['twister_id'], a['spoken_text'],
+                        a['accuracy'], a['time_seconds'], a['score'], a['difficulty'], a['session_type']
+                    )
+                    for attempt_id, a in zip(attempt_ids, attempts)
+                ]
             )
             
-            # Update twister stats
-            await db.execute(
-                """
-                UPDATE tongue_twisters
-                SET times_attempted = times_attempted + 1,
-                    average_accuracy = (
-                        SELECT AVG(accuracy) 
-                        FROM attempts 
-                        WHERE twister_id = ?
+            # Update player stats
+            await db.executemany(
+                UPDATE_PLAYER_STATS_SQL,
+                [
+                    (
+                        1 if a['is_successful'] else 0,
+                        a['score'],
+                        a['score'],
+                        a['twister_id'],
+                        a['score'],
+                        a['time_seconds'],
+                        a['time_seconds'],
+                        now,
+                        a['user_id']
                     )
-                WHERE twister_id = ?
-                """,
-                (twister_id, twister_id)
+                    for a in attempts
+                ]
+            )
+            
+            # Update twister stats
+            await db.executemany(
+                UPDATE_TWISTER_STATS_SQL,
+                [(a['accuracy'], a['twister_id']) for a in attempts]
             )
             
             await db.commit()
         
-        return attempt_id
+        return attempt_ids
     
     # Session operations
     async def create_session(
@@ -228,9 +310,12 @@ class DatabaseManager:
         self,
         session_id: str,
         total_attempts: int,
-        total_score: int
+        total_score: int,
+        now: Optional[datetime] = None
     ):
         """End a session and update stats."""
+        now = now or datetime.utcnow()
+        
         async with self._get_connection() as db:
             await db.execute(
                 """
@@ -240,7 +325,7 @@ class DatabaseManager:
                     total_score = ?
                 WHERE session_id = ?
                 """,
-                (datetime.utcnow(), total_attempts, total_score, session_id)
+                (now, total_attempts, total_score, session_id)
             )
             await db.commit()
     
@@ -253,10 +338,18 @@ class DatabaseManager:
         limit: int = 15
     ) -> List[Dict]:
         """Get leaderboard rankings."""
-        async with self._get_connection() as db:
+        async with self._get_read_connection() as db:
+            # Restrict to players who have played on this server
+            if scope == 'server' and server_id:
+                server_join = SERVER_SCOPE_JOIN
+                params = [server_id]
+            else:
+                server_join = ""
+                params = []
+            
             if difficulty:
                 # Leaderboard by difficulty
-                query = """
+                query = f"""
                     SELECT 
                         p.user_id,
                         p.username,
@@ -265,41 +358,30 @@ class DatabaseManager:
                         ROUND(AVG(a.accuracy), 1) as avg_accuracy,
                         MAX(a.score) as best_score
                     FROM players p
+                    {server_join}
                     INNER JOIN attempts a ON p.user_id = a.user_id
                     WHERE a.difficulty = ?
-                """
-                params = [difficulty]
-                
-                if scope == 'server' and server_id:
-                    query += " AND EXISTS (SELECT 1 FROM sessions s WHERE s.user_id = p.user_id AND s.server_id = ?)"
-                    params.append(server_id)
-                
-                query += """
                     GROUP BY p.user_id, p.username
                     ORDER BY total_score DESC
                     LIMIT ?
                 """
-                params.append(limit)
+                params += [difficulty, limit]
             else:
                 # Overall leaderboard
-                query = """
+                query = f"""
                     SELECT 
-                        user_id,
-                        username,
-                        total_score,
-                        total_attempts,
-                        ROUND(CAST(successful_attempts AS REAL) / total_attempts * 100, 1) as success_rate,
-                        best_score
-                    FROM players
-                    WHERE total_attempts > 0
+                        p.user_id,
+                        p.username,
+                        p.total_score,
+                        p.total_attempts,
+                        ROUND(CAST(p.successful_attempts AS REAL) / p.total_attempts * 100, 1) as success_rate,
+                        p.best_score
+                    FROM players p
+                    {server_join}
+                    WHERE p.total_attempts > 0
+                    ORDER BY p.total_score DESC
+                    LIMIT ?
                 """
-                params = []
-                
-                if scope == 'server' and server_id:
-                    query += " AND EXISTS (SELECT 1 FROM sessions s WHERE s.user_id = players.user_id AND s.server_id = ?)"
-                    params.append(server_id)
-                
-                query += " ORDER BY total_score DESC LIMIT ?"
                 params.append(limit)
             
             async with db.execute(query, params) as cursor:
@@ -333,11 +415,158 @@ class DatabaseManager:
         server_id: Optional[str] = None
     ) -> Optional[int]:
         """Get a player's rank on the leaderboard."""
-        leaderboard = await self.get_leaderboard(scope, server_id, limit=1000)
-        for i, entry in enumerate(leaderboard, 1):
-            if entry['user_id'] == user_id:
-                return i
-        return None
+        if scope == 'server' and server_id:
+            server_join = SERVER_SCOPE_JOIN
+            params = [server_id, user_id]
+        else:
+            server_join = ""
+            params = [user_id]
+        
+        async with self._get_read_connection() as db:
+            rows = await db.execute_fetchall(
+                f"""
+                WITH ranked AS (
+                    SELECT p.user_id, p.total_score
+                    FROM players p
+                    {server_join}
+                    WHERE p.total_attempts > 0
+                )
+                SELECT 1 + (SELECT COUNT(*) FROM ranked r WHERE r.total_score > me.total_score)
+                FROM ranked me
+                WHERE me.user_id = ?
+                """,
+                params
+            )
+            return rows[0][0] if rows else None
+
+    
+    # Custom twister operations
+    async def add_custom_twister(
+        self,
+        text: str,
+        difficulty: str,
+        created_by: str
+    ) -> int:
+        """Add a custom tongue twister and return its ID (custom IDs start at 1000)."""
+        async with self._get_connection() as db:
+            async with db.execute(
+                "SELECT MAX(twister_id) FROM tongue_twisters WHERE twister_id >= 1000"
+            ) as cursor:
+                row = await cursor.fetchone()
+                next_id = (row[0] or 999) + 1
+            
+            await db.execute(
+                """
+                INSERT INTO tongue_twisters 
+                (twister_id, text, difficulty, word_count, focus_sounds, created_by, is_official)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    next_id,
+                    text,
+                    difficulty,
+                    len(text.split()),
+                    "Custom",
+                    created_by,
+                    False
+                )
+            )
+            await db.commit()
+        
+        return next_id
+    
+    async def get_custom_twisters(self, limit: int = 20) -> List[Dict]:
+        """Get the most recently added custom tongue twisters."""
+        async with self._get_read_connection() as db:
+            async with db.execute(
+                """
+                SELECT twister_id, text, difficulty, created_by
+                FROM tongue_twisters
+                WHERE is_official = FALSE
+                ORDER BY twister_id DESC
+                LIMIT ?
+                """,
+                (limit,)
+            ) as cursor:
+                twisters = []
+                async for row in cursor:
+                    twisters.append({
+                        'id': row[0],
+                        'text': row[1],
+                        'difficulty': row[2],
+                        'created_by': row[3]
+                    })
+                
+                return twisters
+    
+    # Daily challenge operations
+    async def get_or_create_daily_challenge(self, challenge_date: date) -> Optional[Dict]:
+        """Get the twister for a day's challenge, picking a random one if none is set."""
+        async with self._get_connection() as db:
+            async with db.execute(
+                "SELECT twister_id FROM daily_challenges WHERE challenge_date = ?",
+                (challenge_date,)
+            ) as cursor:
+                row = await cursor.fetchone()
+            
+            if row:
+                twister_id = row[0]
+            else:
+                twister_id = get_random_twister()['id']
+                await db.execute(
+                    "INSERT INTO daily_challenges (challenge_date, twister_id) VALUES (?, ?)",
+                    (challenge_date, twister_id)
+                )
+                await db.commit()
+            
+            async with db.execute(
+                "SELECT text, difficulty FROM tongue_twisters WHERE twister_id = ?",
+                (twister_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+                if not row:
+                    return None
+                
+                return {
+                    'id': twister_id,
+                    'text': row[0],
+                    'difficulty': row[1]
+                }
+    
+    async def save_daily_attempt(
+        self,
+        attempt_id: str,
+        challenge_date: date,
+        user_id: str,
+        score: int,
+        accuracy: float,
+        time_seconds: float
+    ):
+        """Save a daily challenge attempt."""
+        async with self._get_connection() as db:
+            await db.execute(
+                """
+                INSERT INTO daily_challenge_attempts 
+                (attempt_id, challenge_date, user_id, score, accuracy, time_seconds)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (attempt_id, challenge_date, user_id, score, accuracy, time_seconds)
+            )
+            await db.commit()
+    
+    async def get_daily_rank(self, challenge_date: date, score: int) -> int:
+        """Get the rank a score holds on a day's challenge leaderboard."""
+        async with self._get_read_connection() as db:
+            async with db.execute(
+                """
+                SELECT COUNT(*) + 1
+                FROM daily_challenge_attempts
+                WHERE challenge_date = ? AND score > ?
+                """,
+                (challenge_date, score)
+            ) as cursor:
+                row = await cursor.fetchone()
+                return row[0] if row else 1
 
 
 # Global database manager instance
@@ -16,6 +16,7 @@ from database.models import (
     CREATE_TOURNAMENTS_TABLE,
     CREATE_INDEXES
 )
+from database.manager import CONNECTION_PRAGMAS
 from data.tongue_twisters import TWISTERS
 from dotenv import load_dotenv
 
@@ -30,6 +31,9 @@ async def initialize_database():
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
     
     async with aiosqlite.connect(db_path) as db:
+        # Switch the file to WAL (persists) and tune this connection
+        await db.executescript(CONNECTION_PRAGMAS)
+        
         # Create all tables
         await db.execute(CREATE_PLAYERS_TABLE)
         await db.execute(CREATE_ATTEMPTS_TABLE)
@@ -47,13 +51,13 @@ async def initialize_database():
             await db.execute(index_sql)
         
         # Seed tongue twisters if not already present
-        for twister in TWISTERS:
-            await db.execute(
-                """
-                INSERT OR IGNORE INTO tongue_twisters 
-                (twister_id, text, difficulty, word_count, focus_sounds, is_official)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+        await db.executemany(
+            """
+            INSERT OR IGNORE INTO tongue_twisters 
+            (twister_id, text, difficulty, word_count, focus_sounds, is_official)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     twister['id'],
                     twister['text'],
@@ -62,7 +66,9 @@ async def initialize_database():
                     twister['focus_sounds'],
                     True
                 )
-            )
+                for twister in TWISTERS
+            ]
+        )
         
         # Seed achievements
         achievements = [
@@ -73,15 +79,24 @@ async def initialize_database():
             ('champion', 'Champion', 'Reach #1 on the leaderboard', '🏆'),
         ]
         
-        for achievement_id, name, description, icon in achievements:
-            await db.execute(
-                """
-                INSERT OR IGNORE INTO achievements (achievement_id, name, description, icon)
-                VALUES (?, ?, ?, ?)
-                """,
-                (achievement_id, name, description, icon)
-            )
+        await db.executemany(
+            """
+            INSERT OR IGNORE INTO achievements (achievement_id, name, description, icon)
+            VALUES (?, ?, ?, ?)
+            """,
+            achievements
+        )
         
+        # Both seeds share the implicit transaction opened by the first INSERT
         await db.commit()
+        
+        # Gather planner statistics the first time; PRAGMA optimize keeps them fresh afterwards
+        async with db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ) as cursor:
+            has_stats = await cursor.fetchone() is not None
+        if not has_stats:
+            await db.execute("ANALYZE")
+            await db.commit()
         print(f"Database initialized at {db_path}")
 
@@ -1,5 +1,26 @@
 """Database models and schemas."""
 
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, Union
+
+
+@dataclass(slots=True)
+class PlayerRecord:
+    """A row of the players table (fields in column order), plus optional per-difficulty stats."""
+    user_id: str
+    username: str
+    total_attempts: int = 0
+    successful_attempts: int = 0
+    total_score: int = 0
+    best_score: int = 0
+    best_score_twister_id: Optional[int] = None
+    fastest_time: Optional[float] = None
+    created_at: Optional[Union[str, datetime]] = None
+    last_played: Optional[Union[str, datetime]] = None
+    difficulty_stats: Dict[str, Dict] = field(default_factory=dict)
+
+
 # SQL schemas for all tables
 
 CREATE_PLAYERS_TABLE = """
@@ -140,7 +161,9 @@ CREATE_INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_attempts_twister ON attempts(twister_id);",
     "CREATE INDEX IF NOT EXISTS idx_attempts_score ON attempts(score DESC);",
     "CREATE INDEX IF NOT EXISTS idx_attempts_created ON attempts(created_at DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_attempts_diff_user_cov ON attempts(difficulty, user_id, score, accuracy);",
     "CREATE INDEX IF NOT EXISTS idx_sessions_user ON sessions(user_id);",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_server_user ON sessions(server_id, user_id);",
     "CREATE INDEX IF NOT EXISTS idx_daily_attempts_date ON daily_challenge_attempts(challenge_date);",
     "CREATE INDEX IF NOT EXISTS idx_daily_attempts_user ON daily_challenge_attempts(user_id);",
 ]
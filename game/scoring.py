@@ -1,8 +1,43 @@
 """Scoring calculations for tongue twister attempts."""
 
+from functools import partial
+
 import config
 
 
+# (threshold_seconds, bonus) pairs, fastest threshold first
+_SPEED_BONUS_TABLE = tuple(sorted(config.SPEED_BONUSES.items()))
+
+
+def _score_impl(
+    accuracy: float,
+    time_seconds: float,
+    multiplier: float = 1.0,
+    speed_bonuses: tuple = _SPEED_BONUS_TABLE
+) -> int:
+    """Score an attempt with the speed bonuses and difficulty multiplier already bound."""
+    # Base score from accuracy (0-1000)
+    base_score = accuracy * 10
+    
+    # Speed bonus from the first threshold the time beats
+    for threshold, bonus in speed_bonuses:
+        if time_seconds < threshold:
+            base_score += bonus
+            break
+    
+    # Calculate final score
+    final_score = int(base_score * multiplier)
+    
+    return max(0, final_score)  # Ensure non-negative
+
+
+# Score functions specialized per (lowercase) difficulty, built once at import
+_SCORE_FUNCS = {
+    difficulty.lower(): partial(_score_impl, multiplier=multiplier)
+    for difficulty, multiplier in config.DIFFICULTY_MULTIPLIERS.items()
+}
+
+
 def calculate_score(accuracy: float, time_seconds: float, difficulty: str) -> int:
     """
     Calculate final score based on accuracy, speed, and difficulty.
@@ -15,25 +50,12 @@ def calculate_score(accuracy: float, time_seconds: float, difficulty: str) -> in
     Returns:
         Final score as integer
     """
-    # Base score from accuracy (0-1000)
-    base_score = accuracy * 10
+    # Difficulties are normally already lowercase; only lowercase on a miss
+    score_func = _SCORE_FUNCS.get(difficulty)
+    if score_func is None:
+        score_func = _SCORE_FUNCS.get(difficulty.lower(), _score_impl)
     
-    # Speed bonus
-    speed_bonus = 0
-    if time_seconds < 3:
-        speed_bonus = config.SPEED_BONUSES[3]
-    elif time_seconds < 5:
-        speed_bonus = config.SPEED_BONUSES[5]
-    elif time_seconds < 8:
-        speed_bonus = config.SPEED_BONUSES[8]
-    
-    # Difficulty multiplier
-    multiplier = config.DIFFICULTY_MULTIPLIERS.get(difficulty.lower(), 1.0)
-    
-    # Calculate final score
-    final_score = int((base_score + speed_bonus) * multiplier)
-    
-    return max(0, final_score)  # Ensure non-negative
+    return score_func(accuracy, time_seconds)
 
 
 def is_successful_attempt(accuracy: float) -> bool:
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional, List, Dict
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class TwisterSession:
     """Represents an active tongue twister session."""
     session_id: str
@@ -21,7 +21,7 @@ class TwisterSession:
     active: bool = True
     current_twister_id: Optional[int] = None
     waiting_for_attempt: bool = False
-    attempt_started_at: Optional[datetime] = None
+    attempt_started_at: Optional[float] = None  # time.monotonic() reading
     
     # Stats for this session
     attempts: int = 0
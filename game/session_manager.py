@@ -1,19 +1,25 @@
 """Manages active game sessions."""
 
 from typing import Optional, Dict
+from datetime import datetime
 from game.session import TwisterSession
-import uuid
+from game.uuid_pool import uuid_pool
 
 
 class SessionManager:
     """Manages active tongue twister sessions."""
     
     def __init__(self):
-        # Dictionary mapping (user_id, channel_id) to session
-        self._sessions: Dict[tuple, TwisterSession] = {}
+        # Dictionary mapping packed user/channel key (see _key) to session
+        self._sessions: Dict[str, TwisterSession] = {}
         # Dictionary mapping session_id to session
         self._sessions_by_id: Dict[str, TwisterSession] = {}
     
+    @staticmethod
+    def _key(user_id: str, channel_id: str) -> str:
+        """Pack a user/channel pair into one string key (IDs never contain the separator)."""
+        return user_id + "\x1f" + channel_id
+    
     def create_session(
         self,
         channel_id: str,
@@ -24,7 +30,7 @@ class SessionManager:
         **kwargs
     ) -> TwisterSession:
         """Create a new session."""
-        session_id = str(uuid.uuid4())
+        session_id = uuid_pool.get()
         
         session = TwisterSession(
             session_id=session_id,
@@ -36,7 +42,7 @@ class SessionManager:
             **kwargs
         )
         
-        key = (player_id, channel_id)
+        key = self._key(player_id, channel_id)
         self._sessions[key] = session
         self._sessions_by_id[session_id] = session
         
@@ -44,7 +50,7 @@ class SessionManager:
     
     def get_session(self, user_id: str, channel_id: str) -> Optional[TwisterSession]:
         """Get an active session for a user in a channel."""
-        key = (user_id, channel_id)
+        key = self._key(user_id, channel_id)
         session = self._sessions.get(key)
         
         if session and session.active:
@@ -56,15 +62,19 @@ class SessionManager:
         """Get a session by its ID."""
         return self._sessions_by_id.get(session_id)
     
-    def end_session(self, user_id: str, channel_id: str) -> Optional[TwisterSession]:
+    def end_session(
+        self,
+        user_id: str,
+        channel_id: str,
+        now: Optional[datetime] = None
+    ) -> Optional[TwisterSession]:
         """End a session."""
-        key = (user_id, channel_id)
+        key = self._key(user_id, channel_id)
         session = self._sessions.get(key)
         
         if session:
             session.active = False
-            from datetime import datetime
-            session.ended_at = datetime.utcnow()
+            session.ended_at = now or datetime.utcnow()
             del self._sessions[key]
             # Keep in _sessions_by_id for reference
         
@@ -77,7 +87,8 @@ class SessionManager:
     
     def get_all_sessions(self) -> list[TwisterSession]:
         """Get all active sessions."""
-        return [s for s in self._sessions.values() if s.active]
+        # end_session removes ended sessions, so everything left is active
+        return list(self._sessions.values())
 
 
 # Global session manager instance
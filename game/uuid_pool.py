@@ -0,0 +1,62 @@
+"""Pool of pre-generated UUID strings for IDs created on the request path."""
+
+import asyncio
+import uuid
+from collections import deque
+from typing import Optional, List
+
+POOL_SIZE = 1024
+REFILL_THRESHOLD = 256
+
+
+def _generate(count: int) -> List[str]:
+    """Generate a batch of UUID4 strings."""
+    return [str(uuid.uuid4()) for _ in range(count)]
+
+
+class UUIDPool:
+    """Hands out UUID4 strings, topping itself up in the background."""
+    
+    def __init__(self, size: int = POOL_SIZE, refill_threshold: int = REFILL_THRESHOLD):
+        self.size = size
+        self.refill_threshold = refill_threshold
+        self._pool: deque[str] = deque()
+        self._refill_task: Optional[asyncio.Future] = None
+    
+    def get(self) -> str:
+        """Get a UUID4 string, generating one directly if the pool is empty."""
+        try:
+            value = self._pool.popleft()
+        except IndexError:
+            value = str(uuid.uuid4())
+        
+        if len(self._pool) < self.refill_threshold:
+            self._schedule_refill()
+        
+        return value
+    
+    def _schedule_refill(self):
+        """Start a background refill unless one is already running."""
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. a script); get() keeps generating directly
+            return
+        
+        self._refill_task = loop.create_task(self._refill())
+    
+    async def _refill(self):
+        """Generate the missing UUIDs in a worker thread and add them to the pool."""
+        missing = self.size - len(self._pool)
+        if missing <= 0:
+            return
+        
+        loop = asyncio.get_running_loop()
+        self._pool.extend(await loop.run_in_executor(None, _generate, missing))
+
+
+# Global UUID pool instance
+uuid_pool = UUIDPool()
@@ -7,6 +7,8 @@ from dotenv import load_dotenv
 from bot.client import create_bot
 from bot.events import setup_events
 from database.migrations import initialize_database
+from database.manager import db_manager
+from voice.recorder import close_microphone
 from cogs import game_commands
 
 # Load environment variables
@@ -18,6 +20,7 @@ async def main():
     # Initialize database
     print("Initializing database...")
     await initialize_database()
+    await db_manager.connect()
     print("Database initialized!")
     
     # Create bot
@@ -34,11 +37,16 @@ async def main():
     if not token:
         print("ERROR: DISCORD_TOKEN not found in environment variables!")
         print("Please create a .env file with your Discord bot token.")
+        await db_manager.close()
         return
     
     # Start bot
     print("Starting bot...")
-    await bot.start(token)
+    try:
+        await bot.start(token)
+    finally:
+        await db_manager.close()
+        close_microphone()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,26 @@
 """Discord embed builders for bot responses."""
 
 import discord
-from typing import Optional, List
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional, List, Tuple
 from data.tongue_twisters import get_twister_by_id
+from utils.formatters import truncate_text
+
+# Display labels for the fixed set of difficulty names
+_DIFFICULTY_LABELS = {
+    'easy': 'Easy',
+    'medium': 'Medium',
+    'hard': 'Hard',
+    'insane': 'Insane',
+    'unknown': 'Unknown',
+}
+
+
+def _difficulty_label(difficulty: str) -> str:
+    """Get the display label for a difficulty."""
+    label = _DIFFICULTY_LABELS.get(difficulty)
+    return label if label is not None else difficulty.capitalize()
 
 
 def create_session_started_embed(
@@ -53,7 +71,7 @@ def create_twister_challenge_embed(
     )
     embed.add_field(
         name="Difficulty",
-        value=difficulty.capitalize(),
+        value=_difficulty_label(difficulty),
         inline=True
     )
     embed.add_field(
@@ -112,7 +130,7 @@ def create_results_embed(
     )
     embed.add_field(
         name="Difficulty",
-        value=difficulty.capitalize(),
+        value=_difficulty_label(difficulty),
         inline=True
     )
     embed.add_field(
@@ -136,6 +154,29 @@ def create_results_embed(
     return embed
 
 
+@lru_cache(maxsize=8)
+def _twister_list_fields(
+    twisters: Tuple[Tuple[int, str, str], ...]
+) -> Tuple[Tuple[str, str], ...]:
+    """Build the (name, value) field pairs for a twister list, cached per library content."""
+    # Group by difficulty
+    by_difficulty = defaultdict(list)
+    for twister_id, text, diff in twisters:
+        by_difficulty[diff].append(f"{twister_id}. {text}")
+    
+    # One field for each difficulty
+    fields = []
+    for diff in ['easy', 'medium', 'hard', 'insane']:
+        twister_lines = by_difficulty.get(diff)
+        if twister_lines:
+            fields.append((
+                f"{_difficulty_label(diff)} ({len(twister_lines)})",
+                "\n".join(twister_lines)[:1024]  # Discord field limit
+            ))
+    
+    return tuple(fields)
+
+
 def create_twister_list_embed(
     twisters: List[dict],
     difficulty: Optional[str] = None
@@ -143,34 +184,19 @@ def create_twister_list_embed(
     """Create embed for tongue twister list."""
     title = "📜 Tongue Twister Library"
     if difficulty:
-        title += f" - {difficulty.capitalize()}"
+        title += f" - {_difficulty_label(difficulty)}"
     
     embed = discord.Embed(
         title=title,
         color=discord.Color.blue()
     )
     
-    # Group by difficulty
-    by_difficulty = {}
-    for twister in twisters:
-        diff = twister['difficulty']
-        if diff not in by_difficulty:
-            by_difficulty[diff] = []
-        by_difficulty[diff].append(twister)
-    
-    # Add fields for each difficulty
-    for diff in ['easy', 'medium', 'hard', 'insane']:
-        if diff in by_difficulty:
-            twister_list = by_difficulty[diff]
-            value = "\n".join(
-                f"{t['id']}. {t['text']}"
-                for t in twister_list
-            )
-            embed.add_field(
-                name=f"{diff.capitalize()} ({len(twister_list)})",
-                value=value[:1024],  # Discord field limit
-                inline=False
-            )
+    # Embeds can't be shared between sends, so only the field text is cached
+    fields = _twister_list_fields(
+        tuple((t['id'], t['text'], t['difficulty']) for t in twisters)
+    )
+    for name, value in fields:
+        embed.add_field(name=name, value=value, inline=False)
     
     embed.set_footer(text="Use /twister practice <id> to practice a specific twister!")
     
@@ -229,7 +255,7 @@ def create_challenge_progress_embed(
     
     embed.add_field(
         name="Difficulty",
-        value=difficulty.capitalize(),
+        value=_difficulty_label(difficulty),
         inline=True
     )
     embed.add_field(
@@ -248,6 +274,16 @@ def create_challenge_progress_embed(
     return embed
 
 
+# One line of the challenge results breakdown (%-formatting is cheap for this many lines)
+_RESULT_LINE_FORMAT = "**%d.** %s\n   Score: %s pts | Acc: %.1f%% | Time: %.1fs | %s"
+
+# Results per breakdown field (each field can hold ~5-6 results depending on text length)
+_RESULTS_PER_FIELD = 5
+
+# Twister text is shortened to this many characters so a field stays well under 1024
+_RESULT_TEXT_MAX = 40
+
+
 def create_challenge_complete_embed(
     total_score: int,
     average_accuracy: float,
@@ -294,50 +330,45 @@ def create_challenge_complete_embed(
             inline=True
         )
     
+    embed.set_footer(text="Great job! 🎉 Try again to beat your score!")
+    
+    if not results:
+        return embed
+    
     # Add detailed breakdown of all results
     # Split into multiple fields if needed (Discord field limit is 1024 chars)
-    if results:
-        # Group results into fields (each field can hold ~5-6 results depending on text length)
-        results_per_field = 5
-        num_fields = (len(results) + results_per_field - 1) // results_per_field
+    num_fields = -(-len(results) // _RESULTS_PER_FIELD)
+    
+    for field_idx in range(num_fields):
+        start_idx = field_idx * _RESULTS_PER_FIELD
+        end_idx = min(start_idx + _RESULTS_PER_FIELD, len(results))
+        field_results = results[start_idx:end_idx]
+        
+        field_name = "📝 Results %d-%d" % (start_idx + 1, end_idx) if num_fields > 1 else "📝 Results Breakdown"
         
-        for field_idx in range(num_fields):
-            start_idx = field_idx * results_per_field
-            end_idx = min(start_idx + results_per_field, len(results))
-            field_results = results[start_idx:end_idx]
-            
-            breakdown_lines = []
-            for i, r in enumerate(field_results):
-                result_num = start_idx + i + 1
-                text = r.get('text', 'N/A')
-                score = r.get('score', 0)
-                accuracy = r.get('accuracy', 0)
-                time_sec = r.get('time', 0)
-                difficulty = r.get('difficulty', 'unknown').capitalize()
-                
-                # Format: "1. [Text] | Score: X | Acc: Y% | Time: Zs | [Difficulty]"
-                line = (
-                    f"**{result_num}.** {text}\n"
-                    f"   Score: {score:,} pts | Acc: {accuracy:.1f}% | "
-                    f"Time: {time_sec:.1f}s | {difficulty}"
-                )
-                breakdown_lines.append(line)
-            
-            field_name = f"📝 Results {start_idx + 1}-{end_idx}" if num_fields > 1 else "📝 Results Breakdown"
-            breakdown_text = "\n\n".join(breakdown_lines)
-            
-            # Ensure we don't exceed Discord's 1024 character limit per field
-            if len(breakdown_text) > 1024:
-                # Truncate if needed (shouldn't happen with 5 results, but safety check)
-                breakdown_text = breakdown_text[:1020] + "..."
-            
-            embed.add_field(
-                name=field_name,
-                value=breakdown_text,
-                inline=False
+        # Format: "1. [Text] | Score: X | Acc: Y% | Time: Zs | [Difficulty]"
+        breakdown_text = "\n\n".join(
+            _RESULT_LINE_FORMAT % (
+                result_num,
+                truncate_text(r.get('text') or 'N/A', _RESULT_TEXT_MAX),
+                format(r.get('score', 0), ',d'),
+                r.get('accuracy', 0),
+                r.get('time', 0),
+                _difficulty_label(r.get('difficulty', 'unknown'))
             )
-    
-    embed.set_footer(text="Great job! 🎉 Try again to beat your score!")
+            for result_num, r in enumerate(field_results, start_idx + 1)
+        )
+        
+        # Ensure we don't exceed Discord's 1024 character limit per field
+        if len(breakdown_text) > 1024:
+            # Truncate if needed (shouldn't happen with 5 results, but safety check)
+            breakdown_text = breakdown_text[:1020] + "..."
+        
+        embed.add_field(
+            name=field_name,
+            value=breakdown_text,
+            inline=False
+        )
     
     return embed
 
@@ -5,10 +5,11 @@ from typing import List
 
 def format_time(seconds: float) -> str:
     """Format time in seconds to readable string."""
-    if seconds < 1:
+    # Most attempt times fall between 1 and 60 seconds, so check that first
+    if 1 <= seconds < 60:
+        return "%.1fs" % seconds
+    elif seconds < 1:
         return f"{seconds * 1000:.0f}ms"
-    elif seconds < 60:
-        return f"{seconds:.1f}s"
     else:
         mins = int(seconds // 60)
         secs = seconds % 60
@@ -17,7 +18,7 @@ def format_time(seconds: float) -> str:
 
 def format_score(score: int) -> str:
     """Format score with commas."""
-    return f"{score:,}"
+    return format(score, ',d')
 
 
 def format_percentage(value: float, decimals: int = 1) -> str:
@@ -1,9 +1,30 @@
 """Text normalization and similarity calculations."""
 
 import re
-from typing import List, Set, Dict
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, NamedTuple, Optional, Sequence, Tuple
 from difflib import SequenceMatcher
 
+# Use rapidfuzz's C++ similarity when installed, otherwise fall back to difflib
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Precompiled patterns used on every normalization
+# A whole whitespace-delimited token of digits, optionally followed by letters ("6", "6th")
+_NUMBER_TOKEN_RE = re.compile(r'(?<!\S)(\d+)([a-zA-Z]*)(?!\S)')
+_PUNCT_RE = re.compile(r'[^\w\s]+')
+
+# Translation table dropping the ASCII characters _PUNCT_RE would remove
+# (everything except letters, digits, underscore and whitespace)
+_PUNCT_TRANS = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128))
+    if not (ch.isalnum() or ch == '_' or ch.isspace())
+))
+
 # Number to word mappings - handles when Whisper transcribes numbers as digits
 NUMBER_TO_WORD: Dict[str, str] = {
     '0': 'zero', '1': 'one', '2': 'two', '3': 'three', '4': 'four',
@@ -16,40 +37,61 @@ NUMBER_TO_WORD: Dict[str, str] = {
     '100': 'hundred', '1000': 'thousand',
 }
 
+# Ordinals that aren't just the number word plus its suffix ("1st" -> "first", "20th" -> "twentieth")
+_ORDINAL_SUFFIXES = frozenset(('th', 'st', 'nd', 'rd'))
+_ORDINAL_WORDS: Dict[str, str] = {}
+for _num, _word in NUMBER_TO_WORD.items():
+    if _word.endswith('y'):
+        _ORDINAL_WORDS[_num] = _word[:-1] + 'ieth'
+    elif _word.endswith('one'):
+        _ORDINAL_WORDS[_num] = _word[:-3] + 'first'
+    elif _word.endswith('two'):
+        _ORDINAL_WORDS[_num] = _word[:-3] + 'second'
+    elif _word.endswith('three'):
+        _ORDINAL_WORDS[_num] = _word[:-5] + 'third'
+    elif _word.endswith('five'):
+        _ORDINAL_WORDS[_num] = _word[:-4] + 'fifth'
+    elif _word.endswith('eight'):
+        _ORDINAL_WORDS[_num] = _word + 'h'
+    elif _word.endswith('nine'):
+        _ORDINAL_WORDS[_num] = _word[:-1] + 'th'
+    elif _word.endswith('twelve'):
+        _ORDINAL_WORDS[_num] = _word[:-2] + 'fth'
+
 # Homophone mappings - words that sound the same but are spelled differently
 # This helps handle transcription errors where Whisper picks the wrong spelling
-HOMOPHONE_GROUPS: Dict[str, Set[str]] = {
-    'lorry': {'lorry', 'lori', 'lory', 'lowry'},
-    'lori': {'lorry', 'lori', 'lory', 'lowry'},
-    'lory': {'lorry', 'lori', 'lory', 'lowry'},
-    'lowry': {'lorry', 'lori', 'lory', 'lowry'},
-    'red': {'red', 'read'},
-    'read': {'red', 'read'},
-    'yellow': {'yellow', 'yello'},
-    'yello': {'yellow', 'yello'},
-    'she': {'she', 'shee'},
-    'shee': {'she', 'shee'},
-    'sells': {'sells', 'sels', 'cells'},
-    'sels': {'sells', 'sels', 'cells'},
-    'cells': {'sells', 'sels', 'cells'},
-    'seashells': {'seashells', 'sea shells', 'seashell', 'sea shell'},
-    'seashell': {'seashells', 'sea shells', 'seashell', 'sea shell'},
-    'sea shells': {'seashells', 'sea shells', 'seashell', 'sea shell'},
-    'sea shell': {'seashells', 'sea shells', 'seashell', 'sea shell'},
-    'by': {'by', 'buy', 'bye'},
-    'buy': {'by', 'buy', 'bye'},
-    'bye': {'by', 'buy', 'bye'},
-    'the': {'the', 'thee'},
-    'thee': {'the', 'thee'},
-    'seashore': {'seashore', 'sea shore', 'seashor'},
-    'sea shore': {'seashore', 'sea shore', 'seashor'},
-    'seashor': {'seashore', 'sea shore', 'seashor'},
-    'seaward': {'seaward', 'seward'},
-    'seward': {'seaward', 'seward'},
-    'six': {'six', '6'},
-    '6': {'six', '6'},
-    'sixth': {'sixth', '6th'},
-    '6th': {'sixth', '6th'},
+HOMOPHONE_GROUPS: Dict[str, FrozenSet[str]] = {
+    'lorry': frozenset({'lorry', 'lori', 'lory', 'lowry'}),
+    'lori': frozenset({'lorry', 'lori', 'lory', 'lowry'}),
+    'lory': frozenset({'lorry', 'lori', 'lory', 'lowry'}),
+    'lowry': frozenset({'lorry', 'lori', 'lory', 'lowry'}),
+    'red': frozenset({'red', 'read'}),
+    'read': frozenset({'red', 'read'}),
+    'yellow': frozenset({'yellow', 'yello'}),
+    'yello': frozenset({'yellow', 'yello'}),
+    'she': frozenset({'she', 'shee'}),
+    'shee': frozenset({'she', 'shee'}),
+    'sells': frozenset({'sells', 'sels', 'cells'}),
+    'sels': frozenset({'sells', 'sels', 'cells'}),
+    'cells': frozenset({'sells', 'sels', 'cells'}),
+    'seashells': frozenset({'seashells', 'sea shells', 'seashell', 'sea shell'}),
+    'seashell': frozenset({'seashells', 'sea shells', 'seashell', 'sea shell'}),
+    'sea shells': frozenset({'seashells', 'sea shells', 'seashell', 'sea shell'}),
+    'sea shell': frozenset({'seashells', 'sea shells', 'seashell', 'sea shell'}),
+    'by': frozenset({'by', 'buy', 'bye'}),
+    'buy': frozenset({'by', 'buy', 'bye'}),
+    'bye': frozenset({'by', 'buy', 'bye'}),
+    'the': frozenset({'the', 'thee'}),
+    'thee': frozenset({'the', 'thee'}),
+    'seashore': frozenset({'seashore', 'sea shore', 'seashor'}),
+    'sea shore': frozenset({'seashore', 'sea shore', 'seashor'}),
+    'seashor': frozenset({'seashore', 'sea shore', 'seashor'}),
+    'seaward': frozenset({'seaward', 'seward'}),
+    'seward': frozenset({'seaward', 'seward'}),
+    'six': frozenset({'six', '6'}),
+    '6': frozenset({'six', '6'}),
+    'sixth': frozenset({'sixth', '6th'}),
+    '6th': frozenset({'sixth', '6th'}),
 }
 
 # Create reverse lookup: word -> canonical form (first word in group)
@@ -58,67 +100,80 @@ for canonical, group in HOMOPHONE_GROUPS.items():
     for word in group:
         HOMOPHONE_MAP[word] = canonical
 
+# Word -> integer ID of its homophone group, so comparisons are a single int check
+HOMOPHONE_ID: Dict[str, int] = {}
+for group_id, group in enumerate(set(HOMOPHONE_GROUPS.values())):
+    for word in group:
+        HOMOPHONE_ID[word] = group_id
+
 
 def convert_numbers_to_words(text: str) -> str:
     """
     Convert numeric digits to their word equivalents.
     
-    Handles standalone numbers like "6" -> "six"
+    Handles standalone numbers like "6" -> "six" and ordinals like "6th" -> "sixth"
+    """
+    return _NUMBER_TOKEN_RE.sub(_number_token_to_words, text)
+
+
+def _number_token_to_words(match: re.Match) -> str:
+    """Replacement callback for _NUMBER_TOKEN_RE."""
+    num_part = match.group(1)
+    base_word = NUMBER_TO_WORD.get(num_part)
+    if base_word is None:
+        # For numbers not in our mapping, keep as-is
+        return match.group(0)
+    
+    suffix = match.group(2).lower()
+    if not suffix:
+        return base_word
+    if suffix in _ORDINAL_SUFFIXES:
+        # Convert "6th" -> "sixth", "1st" -> "first", etc.
+        return _ORDINAL_WORDS.get(num_part, base_word + suffix)
+    return base_word + suffix
+
+
+def _lcs_length(a: str, b: str) -> int:
+    """
+    Length of the longest common subsequence of two strings.
+    
+    Bit-parallel (one big-int step per character of b) instead of the
+    quadratic difflib matcher.
+    """
+    if not a or not b:
+        return 0
+    
+    # Bit i of a character's mask is set where a[i] is that character
+    char_masks: Dict[str, int] = {}
+    for i, ch in enumerate(a):
+        char_masks[ch] = char_masks.get(ch, 0) | (1 << i)
+    
+    all_bits = (1 << len(a)) - 1
+    v = all_bits
+    for ch in b:
+        u = v & char_masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & all_bits
+    
+    # Each zero bit left in v is one matched character
+    return len(a) - bin(v).count('1')
+
+
+def _char_similarity(a: str, b: str) -> float:
+    """
+    Character-level similarity ratio between two strings (0.0 to 1.0).
+    
+    Uses the indel ratio 2 * LCS / (len(a) + len(b)), the same measure as
+    rapidfuzz.fuzz.ratio, so scores don't depend on whether rapidfuzz is installed.
     """
-    words = text.split()
-    converted_words = []
-    
-    for word in words:
-        # Check if word is a pure number (digits only)
-        if word.isdigit():
-            # Convert number to word if we have a mapping
-            word_lower = word.lower()
-            if word_lower in NUMBER_TO_WORD:
-                converted_words.append(NUMBER_TO_WORD[word_lower])
-            else:
-                # For numbers not in our mapping, try to keep as-is
-                # but we could add more sophisticated number-to-word conversion
-                converted_words.append(word)
-        else:
-            # Check for numbers with suffixes like "6th" -> "sixth"
-            # Match pattern: digits followed by letters (like "6th", "1st", etc.)
-            match = re.match(r'^(\d+)([a-z]+)$', word.lower())
-            if match:
-                num_part = match.group(1)
-                suffix = match.group(2)
-                if num_part in NUMBER_TO_WORD:
-                    # Convert "6th" -> "sixth", "1st" -> "first", etc.
-                    base_word = NUMBER_TO_WORD[num_part]
-                    # Handle common ordinal suffixes
-                    if suffix in ['th', 'st', 'nd', 'rd']:
-                        if base_word.endswith('y'):
-                            # "twenty" -> "twentieth"
-                            ordinal = base_word[:-1] + 'ieth'
-                        elif base_word.endswith('one'):
-                            ordinal = base_word[:-3] + 'first'
-                        elif base_word.endswith('two'):
-                            ordinal = base_word[:-3] + 'second'
-                        elif base_word.endswith('three'):
-                            ordinal = base_word[:-5] + 'third'
-                        elif base_word.endswith('five'):
-                            ordinal = base_word[:-4] + 'fifth'
-                        elif base_word.endswith('eight'):
-                            ordinal = base_word[:-1] + 'h'
-                        elif base_word.endswith('nine'):
-                            ordinal = base_word[:-1]
-                        else:
-                            ordinal = base_word + suffix
-                        converted_words.append(ordinal)
-                    else:
-                        converted_words.append(base_word + suffix)
-                else:
-                    converted_words.append(word)
-            else:
-                converted_words.append(word)
-    
-    return ' '.join(converted_words)
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(a, b) / 100.0
+    total_len = len(a) + len(b)
+    if not total_len:
+        return 1.0
+    return 2 * _lcs_length(a, b) / total_len
 
 
+@lru_cache(maxsize=1024)
 def normalize_text(text: str) -> str:
     """
     Normalize text for comparison.
@@ -139,16 +194,21 @@ def normalize_text(text: str) -> str:
     # This way "6" becomes "six" before we strip it
     text = convert_numbers_to_words(text)
     
-    # Remove punctuation except spaces
-    text = re.sub(r'[^\w\s]', '', text)
-    
-    # Collapse multiple spaces into single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Strip leading/trailing spaces
-    text = text.strip()
+    # Remove punctuation except spaces (translate is much cheaper than the
+    # regex for the ASCII transcripts we normally see)
+    if text.isascii():
+        text = text.translate(_PUNCT_TRANS)
+    else:
+        text = _PUNCT_RE.sub('', text)
     
-    return text
+    # Collapse multiple spaces and strip leading/trailing spaces in one pass
+    return ' '.join(text.split())
+
+
+@lru_cache(maxsize=512)
+def get_target_words(target_normalized: str) -> Tuple[str, ...]:
+    """Split a normalized target text into words, cached since targets repeat across attempts."""
+    return tuple(target_normalized.split())
 
 
 def are_homophones(word1: str, word2: str) -> bool:
@@ -166,67 +226,67 @@ def are_homophones(word1: str, word2: str) -> bool:
         return True
     
     # Check if both words are in the same homophone group
-    canonical1 = HOMOPHONE_MAP.get(word1, word1)
-    canonical2 = HOMOPHONE_MAP.get(word2, word2)
-    
-    if canonical1 == canonical2:
-        return True
-    
-    # Check if they're in the same group
-    group1 = HOMOPHONE_GROUPS.get(canonical1, set())
-    group2 = HOMOPHONE_GROUPS.get(canonical2, set())
-    
-    return bool(group1 & group2)  # Intersection is non-empty
+    group_id = HOMOPHONE_ID.get(word1)
+    return group_id is not None and group_id == HOMOPHONE_ID.get(word2)
 
 
-def calculate_accuracy(spoken: str, target: str) -> float:
+def calculate_accuracy(
+    spoken: str,
+    target: str,
+    target_normalized: Optional[str] = None
+) -> float:
     """
     Calculate similarity between spoken and target text.
     
     Uses word-level matching with homophone awareness for better accuracy.
     Returns accuracy as a percentage (0.0 to 100.0).
+    
+    Pass target_normalized when the normalized target is already known
+    (e.g. a library twister's cached 'normalized' field) to skip re-normalizing it.
     """
     if not spoken or not target:
         return 0.0
     
     # Normalize both texts
     spoken_normalized = normalize_text(spoken)
-    target_normalized = normalize_text(target)
+    if target_normalized is None:
+        target_normalized = normalize_text(target)
     
+    return _normalized_accuracy(spoken_normalized, target_normalized)
+
+
+@lru_cache(maxsize=256)
+def _normalized_accuracy(spoken_normalized: str, target_normalized: str) -> float:
+    """Accuracy percentage for two normalized texts, cached since retries often repeat a transcript."""
     if not spoken_normalized or not target_normalized:
         return 0.0
     
+    # Perfect attempts are the common success case; skip the diff entirely
+    if spoken_normalized == target_normalized:
+        return 100.0
+    
     # Word-level matching with homophone awareness
     spoken_words = spoken_normalized.split()
-    target_words = target_normalized.split()
+    target_words = get_target_words(target_normalized)
     
     if not spoken_words or not target_words:
         # Fallback to string similarity if no words
-        similarity = SequenceMatcher(None, spoken_normalized, target_normalized).ratio()
+        similarity = _char_similarity(spoken_normalized, target_normalized)
         return similarity * 100.0
     
-    # Count matching words (including homophones)
-    matches = 0
+    # Count matching words (including homophones); missing or extra words
+    # past the shorter list never match
     max_len = max(len(spoken_words), len(target_words))
-    
-    for i in range(max_len):
-        if i >= len(spoken_words) or i >= len(target_words):
-            # Missing or extra word
-            continue
-        
-        spoken_word = spoken_words[i]
-        target_word = target_words[i]
-        
-        if spoken_word == target_word:
-            matches += 1
-        elif are_homophones(spoken_word, target_word):
-            matches += 1  # Homophones count as matches
+    matches = sum(
+        1 for spoken_word, target_word in zip(spoken_words, target_words)
+        if spoken_word == target_word or are_homophones(spoken_word, target_word)
+    )
     
     # Word-level accuracy
     word_accuracy = matches / max_len if max_len > 0 else 0.0
     
     # Also calculate character-level similarity for fine-tuning
-    char_similarity = SequenceMatcher(None, spoken_normalized, target_normalized).ratio()
+    char_similarity = _char_similarity(spoken_normalized, target_normalized)
     
     # Weighted combination: 70% word accuracy, 30% character similarity
     # This gives more weight to getting words right (including homophones)
@@ -235,38 +295,104 @@ def calculate_accuracy(spoken: str, target: str) -> float:
     return final_accuracy * 100.0
 
 
-def find_differences(spoken: str, target: str) -> List[str]:
+def _describe_difference(spoken_word: str, target_word: str) -> Optional[str]:
+    """Describe how a spoken word differs from its target word, or None if it matches."""
+    if spoken_word == target_word:
+        return None
+    if are_homophones(spoken_word, target_word):
+        # Homophone - note it but don't count as mistake
+        return f"'{spoken_word}' (homophone of '{target_word}') ✓"
+    return f"'{spoken_word}' → '{target_word}'"
+
+
+def _word_opcodes(spoken_keys: List, target_keys: List) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Align two word sequences by edit distance.
+    
+    Returns difflib-style (tag, i1, i2, j1, j2) opcodes, where tag is 'equal',
+    'replace', 'insert' or 'delete'.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.opcodes(spoken_keys, target_keys).as_list()
+    return SequenceMatcher(None, spoken_keys, target_keys, autojunk=False).get_opcodes()
+
+
+def _word_mistakes(spoken_words: List[str], target_words: Sequence[str]) -> List[str]:
+    """Describe the differences between aligned spoken and target words."""
+    # Align on homophone groups so homophones line up like identical words
+    spoken_keys = [HOMOPHONE_ID.get(word, word) for word in spoken_words]
+    target_keys = [HOMOPHONE_ID.get(word, word) for word in target_words]
+    
+    mistakes = []
+    for tag, i1, i2, j1, j2 in _word_opcodes(spoken_keys, target_keys):
+        paired = min(i2 - i1, j2 - j1)
+        for k in range(paired):
+            mistake = _describe_difference(spoken_words[i1 + k], target_words[j1 + k])
+            if mistake:
+                mistakes.append(mistake)
+        mistakes.extend(f"Extra word: '{word}'" for word in spoken_words[i1 + paired:i2])
+        mistakes.extend(f"Missing word: '{word}'" for word in target_words[j1 + paired:j2])
+    
+    return mistakes
+
+
+def find_differences(
+    spoken: str,
+    target: str,
+    target_normalized: Optional[str] = None
+) -> List[str]:
     """
     Find word-level differences between spoken and target text.
     
+    Words are aligned by edit distance, so a single missing or extra word
+    doesn't shift every following word into a mistake.
+    
     Returns a list of mistake descriptions.
     Homophones are not counted as mistakes.
     """
     spoken_normalized = normalize_text(spoken)
-    target_normalized = normalize_text(target)
+    if target_normalized is None:
+        target_normalized = normalize_text(target)
     
-    spoken_words = spoken_normalized.split()
-    target_words = target_normalized.split()
+    if spoken_normalized == target_normalized:
+        return []
     
-    mistakes = []
+    return _word_mistakes(spoken_normalized.split(), get_target_words(target_normalized))
+
+
+class AccuracyReport(NamedTuple):
+    """Accuracy and word-level mistakes for one attempt."""
+    accuracy: float
+    mistakes: List[str]
+
+
+def score_attempt(
+    spoken: str,
+    target: str,
+    target_normalized: Optional[str] = None
+) -> AccuracyReport:
+    """
+    Calculate accuracy and word-level differences together.
     
-    # Word-by-word comparison with homophone awareness
-    max_len = max(len(spoken_words), len(target_words))
-    for i in range(max_len):
-        if i >= len(spoken_words):
-            mistakes.append(f"Missing word: '{target_words[i]}'")
-        elif i >= len(target_words):
-            mistakes.append(f"Extra word: '{spoken_words[i]}'")
-        else:
-            spoken_word = spoken_words[i]
-            target_word = target_words[i]
-            
-            if spoken_word != target_word:
-                if are_homophones(spoken_word, target_word):
-                    # Homophone - note it but don't count as mistake
-                    mistakes.append(f"'{spoken_word}' (homophone of '{target_word}') ✓")
-                else:
-                    mistakes.append(f"'{spoken_word}' → '{target_words[i]}'")
+    Gives the same results as calling calculate_accuracy and find_differences,
+    but normalizes and splits the texts only once.
     
-    return mistakes
-
+    Returns:
+        AccuracyReport of (accuracy percentage, list of mistake descriptions)
+    """
+    spoken_normalized = normalize_text(spoken)
+    if target_normalized is None:
+        target_normalized = normalize_text(target)
+    
+    if spoken_normalized == target_normalized:
+        accuracy = 100.0 if spoken and target and spoken_normalized else 0.0
+        return AccuracyReport(accuracy, [])
+    
+    spoken_words = spoken_normalized.split()
+    target_words = get_target_words(target_normalized)
+    mistakes = _word_mistakes(spoken_words, target_words)
+    
+    if not spoken or not target:
+        return AccuracyReport(0.0, mistakes)
+    
+    return AccuracyReport(_normalized_accuracy(spoken_normalized, target_normalized), mistakes)
@@ -4,6 +4,8 @@ import discord
 from discord.ext import commands
 from typing import Optional
 
+from voice.recorder import AudioRecorder
+
 # Try to import voice receiving extension
 try:
     from discord.ext import voice_recv
@@ -18,6 +20,7 @@ class VoiceHandler:
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.voice_clients: dict[int, discord.VoiceClient] = {}
+        self.recorders: dict[int, AudioRecorder] = {}  # voice channel id -> recorder
     
     async def join_voice_channel(
         self,
@@ -43,6 +46,7 @@ class VoiceHandler:
             # If VoiceRecv is available but we have a regular VoiceClient, reconnect
             if VOICE_RECV_AVAILABLE and not isinstance(existing_client, voice_recv.VoiceRecvClient):
                 print("[INFO] Reconnecting with VoiceRecvClient to enable audio receiving...")
+                self.recorders.pop(channel.id, None)
                 try:
                     await existing_client.disconnect()
                     del self.voice_clients[channel.id]
@@ -83,6 +87,7 @@ class VoiceHandler:
             return False
         
         voice_client = self.voice_clients[channel_id]
+        self.recorders.pop(channel_id, None)
         
         try:
             await voice_client.disconnect()
@@ -95,4 +100,21 @@ class VoiceHandler:
     def get_voice_client(self, channel_id: int) -> Optional[discord.VoiceClient]:
         """Get voice client for a channel."""
         return self.voice_clients.get(channel_id)
-
+    
+    def get_recorder(self, voice_client: discord.VoiceClient) -> AudioRecorder:
+        """Get the recorder cached for a voice connection, creating it on first use."""
+        # Drop recorders whose connection has gone away (bot kicked, moved or disconnected)
+        for channel_id in [cid for cid, r in self.recorders.items() if not r.voice_client.is_connected()]:
+            del self.recorders[channel_id]
+        
+        channel_id = voice_client.channel.id
+        recorder = self.recorders.get(channel_id)
+        if recorder is not None and recorder.recording:
+            # Another attempt is still recording on this channel; don't clobber it
+            return AudioRecorder(voice_client)
+        if recorder is None or recorder.voice_client is not voice_client:
+            recorder = AudioRecorder(voice_client)
+            self.recorders[channel_id] = recorder
+        else:
+            recorder.reset()
+        return recorder
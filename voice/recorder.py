@@ -7,11 +7,16 @@ This allows recording any user's voice in the channel, not just the local microp
 import discord
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 from datetime import datetime
+import itertools
+import math
+import threading
 import wave
 import numpy as np
 import time
+import warnings
+from collections import deque
 import config
 
 # Try to import voice receiving extension
@@ -23,6 +28,152 @@ except ImportError:
     print("[WARNING] discord-ext-voice-recv not installed. Install with: pip install discord-ext-voice-recv")
     print("[WARNING] Falling back to system microphone recording.")
 
+# audioop gives the peak of raw 16-bit PCM without building an array
+# (deprecated in Python 3.11 and removed in 3.13, so fall back to NumPy)
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+    AUDIOOP_AVAILABLE = True
+except ImportError:
+    AUDIOOP_AVAILABLE = False
+
+# Optional: libsndfile writer for WAV output (falls back to the wave module)
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDFILE_AVAILABLE = False
+
+# discord's Opus decoder always produces 48kHz 16-bit stereo PCM
+DISCORD_SAMPLE_RATE = 48000
+DISCORD_CHANNELS = 2
+
+# Smallest int16 amplitude that counts as sound (max_level < VOICE_SILENCE_LEVEL is silence)
+SILENCE_INT16_THRESHOLD = math.ceil(config.VOICE_SILENCE_LEVEL * 32768)
+
+# Smallest int16 peak that counts as speech for VAD (level >= VOICE_ACTIVITY_THRESHOLD)
+SPEECH_INT16_THRESHOLD = math.ceil(config.VOICE_ACTIVITY_THRESHOLD * 32768)
+
+# Recordings are normalized so the peak sits at 90% of full scale
+NORMALIZE_PEAK_INT16 = round(0.9 * 32767)
+NORMALIZE_BLOCK_SAMPLES = 65536
+
+
+# PyAudio instance and default input device for the microphone fallback, set up on
+# first use and shared by all recorders (PortAudio init and device probing are slow)
+_pyaudio = None
+_mic_channels = 1
+_mic_device_index = None
+_pyaudio_lock = threading.Lock()
+
+
+def _get_microphone():
+    """Get the shared PyAudio instance, channel count and default input device index."""
+    global _pyaudio, _mic_channels, _mic_device_index
+    with _pyaudio_lock:
+        if _pyaudio is None:
+            import pyaudio
+            p = pyaudio.PyAudio()
+            
+            # Get default input device
+            try:
+                default_device = p.get_default_input_device_info()
+                max_channels = int(default_device['maxInputChannels'])
+                device_name = default_device['name']
+                _mic_device_index = default_device['index']
+                print(f"[INFO] Using microphone: {device_name} (Device {_mic_device_index}, {max_channels} channels)")
+                _mic_channels = 1 if max_channels >= 1 else max_channels
+            except Exception as e:
+                print(f"[WARNING] Could not get device info: {e}, using mono")
+                _mic_channels = 1
+                _mic_device_index = None
+            
+            _pyaudio = p
+        return _pyaudio, _mic_channels, _mic_device_index
+
+
+def close_microphone():
+    """Release the shared PyAudio instance, if the microphone fallback ever created one."""
+    global _pyaudio
+    with _pyaudio_lock:
+        if _pyaudio is not None:
+            _pyaudio.terminate()
+            _pyaudio = None
+
+
+def _peak_level(samples: np.ndarray) -> float:
+    """Peak level of int16 samples as a fraction of full scale (0.0 if empty)."""
+    if not samples.size:
+        return 0.0
+    return float(np.abs(samples.astype(np.int32)).max()) / 32768.0
+
+
+def _normalize_in_place(samples: np.ndarray, max_val: int):
+    """Scale int16 samples in place so that max_val maps to NORMALIZE_PEAK_INT16.
+    
+    Uses a Q15 fixed-point gain and a small reused int32 scratch block, so there is no
+    float32 copy of the whole recording. |sample * gain| stays below 2**31 because
+    |sample| <= max_val.
+    """
+    gain_q15 = np.int32((NORMALIZE_PEAK_INT16 << 15) // max_val)
+    scratch = np.empty(min(samples.size, NORMALIZE_BLOCK_SAMPLES), dtype=np.int32)
+    for start in range(0, samples.size, scratch.size):
+        block = samples[start:start + scratch.size]
+        work = scratch[:block.size]
+        np.multiply(block, gain_q15, out=work, dtype=np.int32)
+        np.right_shift(work, 15, out=work)
+        block[...] = work
+
+
+def _pcm_peak(pcm: bytes) -> int:
+    """Peak absolute value of raw int16 PCM bytes."""
+    if AUDIOOP_AVAILABLE:
+        return audioop.max(pcm, 2)
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    return max(int(samples.max()), -int(samples.min()))
+
+
+# Recording filenames share one timestamp per bot session plus a running counter
+# (no strftime per recording, and no clashes between recordings in the same second)
+_SESSION_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
+_recording_counter = itertools.count()
+
+
+def _new_recording_path(user_id: int) -> Path:
+    """Path for a new recording WAV under data/audio."""
+    data_dir = Path("data/audio")
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir / f"recording_{user_id}_{_SESSION_TIMESTAMP}_{next(_recording_counter):04d}.wav"
+
+
+def _display_name(user) -> str:
+    """Display name of a voice user for log output."""
+    if user is None:
+        return "None"
+    return getattr(user, 'display_name', getattr(user, 'name', 'Unknown'))
+
+
+def _write_wav(filepath: Path, samples: np.ndarray, sample_rate: int, channels: int):
+    """Write interleaved int16 samples to a 16-bit PCM WAV file."""
+    if SOUNDFILE_AVAILABLE:
+        frames = samples.reshape(-1, channels) if channels > 1 else samples
+        sf.write(str(filepath), frames, sample_rate, subtype='PCM_16')
+        return
+    
+    with wave.open(str(filepath), 'wb') as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)  # 16-bit
+        wf.setframerate(sample_rate)
+        wf.writeframes(memoryview(samples))  # no tobytes() copy
+
+
+class RecordedAudio(NamedTuple):
+    """A recording held in memory as interleaved int16 PCM."""
+    samples: np.ndarray
+    sample_rate: int
+    channels: int
+
 
 class AudioRecorder:
     """Records audio from Discord voice channels."""
@@ -31,24 +182,36 @@ class AudioRecorder:
         self.voice_client = voice_client
         self.recording = False
         self.target_user_id = None
-        self.recorded_file = None
-        self.audio_buffer = []
+        self.recorded_audio = None
+        # Ring buffer of the most recent chunks before speech is confirmed
+        self.pre_buffer = deque(maxlen=config.VOICE_PREBUFFER_SIZE)
+        self.sink = None
+    
+    def reset(self):
+        """Clear per-recording state so this recorder can be reused for the next attempt."""
+        self.recording = False
+        self.target_user_id = None
+        self.recorded_audio = None
+        self.pre_buffer.clear()
         self.sink = None
     
     async def record_user_audio(
         self,
         user_id: int,
         timeout: float = None
-    ) -> Optional[str]:
+    ) -> Optional[RecordedAudio]:
         """
         Record audio from a user in Discord voice channel.
         
+        The audio stays in memory; it is only written to data/audio when
+        VOICE_SAVE_RECORDINGS is enabled.
+        
         Args:
             user_id: Discord user ID to record
             timeout: Maximum recording time in seconds
             
         Returns:
-            Path to audio file or None
+            Recorded audio or None
         """
         if timeout is None:
             timeout = config.VOICE_RECORDING_TIMEOUT
@@ -87,25 +250,16 @@ class AudioRecorder:
         # Fallback to system microphone
         return await self._record_from_microphone_fallback(user_id, timeout)
     
-    async def _record_from_discord(self, user_id: int, timeout: float) -> Optional[str]:
+    async def _record_from_discord(self, user_id: int, timeout: float) -> Optional[RecordedAudio]:
         """Record audio directly from Discord voice channel."""
         print(f"[INFO] Recording from Discord voice channel for user {user_id}")
         
         self.target_user_id = user_id
         self.recording = True
-        self.audio_buffer = []
-        self.pre_buffer = []  # Buffer audio before speech is detected
+        self.pre_buffer.clear()  # Buffer audio before speech is detected
         self.speech_detected = False  # Track if we've detected speech yet
         last_audio_time = [None]  # Use list to allow modification in nested function
         
-        # Prepare output file
-        data_dir = Path("data/audio")
-        data_dir.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"recording_{user_id}_{timestamp}.wav"
-        filepath = data_dir / filename
-        
         # Check if voice_client is a VoiceRecvClient
         if not isinstance(self.voice_client, voice_recv.VoiceRecvClient):
             raise TypeError(f"VoiceClient is not a VoiceRecvClient (got {type(self.voice_client).__name__})")
@@ -113,12 +267,17 @@ class AudioRecorder:
         # Create a custom sink that filters by user
         # Use AudioSink as the base class (not MultiAudioSink which requires destinations)
         class UserAudioSink(voice_recv.AudioSink):
-            def __init__(self, target_user_id, audio_buffer, pre_buffer, speech_detected_ref, last_audio_time_ref):
+            def __init__(self, target_user_id, max_samples, pre_buffer, speech_detected_ref, last_audio_time_ref, on_speech):
                 super().__init__()
                 self.target_user_id = target_user_id
-                self.audio_buffer = audio_buffer
+                # Recorded PCM goes into one preallocated buffer at a running offset
+                self.pcm = np.empty(max_samples, dtype=np.int16)
+                self._pcm_bytes = memoryview(self.pcm).cast('B')  # Byte view, so frames copy in without an ndarray
+                self.pcm_len = 0
+                self.chunk_count = 0
                 self.pre_buffer = pre_buffer
                 self.speech_detected_ref = speech_detected_ref
+                self.on_speech = on_speech  # Called (from the receive thread) once speech is confirmed
                 self.last_audio_time_ref = last_audio_time_ref
                 self._write_call_count = 0  # Track all write() calls for debugging
                 self._speech_chunks_count = 0  # Count consecutive chunks with speech
@@ -127,83 +286,84 @@ class AudioRecorder:
             def wants_opus(self):
                 return False  # We want PCM audio
             
+            def append_pcm(self, pcm_data):
+                """Copy a chunk of raw PCM into the buffer, growing it if the estimate was too small."""
+                end = self.pcm_len + len(pcm_data) // 2
+                if end > self.pcm.size:
+                    grown = np.empty(max(end, self.pcm.size * 2), dtype=np.int16)
+                    grown[:self.pcm_len] = self.pcm[:self.pcm_len]
+                    self.pcm = grown
+                    self._pcm_bytes = memoryview(self.pcm).cast('B')
+                self._pcm_bytes[self.pcm_len * 2:end * 2] = pcm_data
+                self.pcm_len = end
+                self.chunk_count += 1
+            
             def write(self, user, data: voice_recv.VoiceData):
                 """Called when audio is received from a user."""
                 try:
-                    # Log ALL audio received for debugging
-                    if user:
-                        user_id_received = user.id
-                        user_name = getattr(user, 'display_name', getattr(user, 'name', 'Unknown'))
-                    else:
-                        user_id_received = None
-                        user_name = "None"
+                    # This runs ~50 times a second per speaker, so debug output (and the
+                    # user name lookup it needs) is skipped unless VOICE_DEBUG_LOGGING is on
+                    self._write_call_count += 1
+                    is_target = user is not None and user.id == self.target_user_id
                     
-                    # ALWAYS log the first few calls to verify sink is receiving ANY audio
-                    # This is critical for debugging - if we never see this, Discord isn't sending audio
-                    total_calls = getattr(self, '_write_call_count', 0)
-                    self._write_call_count = total_calls + 1
+                    # Log the first few calls to verify sink is receiving ANY audio
+                    # If we never see this, Discord isn't sending audio
+                    if config.VOICE_DEBUG_LOGGING and self._write_call_count <= 5:  # First 5 calls regardless of user
+                        user_id_received = user.id if user else None
+                        print(f"[DEBUG] write() called #{self._write_call_count}: user={_display_name(user)} (ID: {user_id_received}), target={self.target_user_id}, match={is_target}")
                     
-                    if total_calls < 5:  # Log first 5 calls regardless of user
-                        print(f"[DEBUG] write() called #{total_calls + 1}: user={user_name} (ID: {user_id_received}), target={self.target_user_id}, match={user and user.id == self.target_user_id if user else False}")
+                    # Audio from other users (or with no user) is discarded without further work
+                    if not is_target:
+                        return
                     
-                    if user and user.id == self.target_user_id:
-                        # Get PCM data from VoiceData
-                        if hasattr(data, 'pcm') and data.pcm:
-                            pcm_data = data.pcm
-                            # Convert PCM bytes to numpy array
-                            audio_array = np.frombuffer(pcm_data, dtype=np.int16)
-                            
-                            # Voice Activity Detection (VAD) - check if this chunk has speech
-                            audio_level = np.abs(audio_array).max() / 32768.0  # Normalize to 0-1
-                            has_speech = audio_level >= config.VOICE_ACTIVITY_THRESHOLD
-                            
-                            # Require multiple consecutive chunks with speech before starting recording
-                            # This prevents false positives from brief noise or background sounds
-                            if has_speech:
-                                self._speech_chunks_count += 1
-                            else:
-                                self._speech_chunks_count = 0  # Reset if we hit silence
-                            
-                            # Update speech detection status (only after confirmation)
-                            if (self._speech_chunks_count >= config.VOICE_VAD_CONFIRMATION_CHUNKS and 
-                                not self.speech_detected_ref[0]):
-                                self.speech_detected_ref[0] = True
-                                print(f"[INFO] Speech confirmed! Starting recording...")
-                                # Move pre-buffer to main buffer (keep only last few chunks before confirmed speech)
-                                keep_chunks = min(len(self.pre_buffer), config.VOICE_PREBUFFER_SIZE)
-                                if keep_chunks > 0:
-                                    self.audio_buffer.extend(self.pre_buffer[-keep_chunks:])
+                    # Get PCM data from VoiceData
+                    pcm_data = getattr(data, 'pcm', None)
+                    if pcm_data:
+                        
+                        # Voice Activity Detection (VAD) - check if this chunk has speech
+                        # (peak straight from the PCM bytes; chunks stay as bytes until recorded)
+                        has_speech = _pcm_peak(pcm_data) >= SPEECH_INT16_THRESHOLD
+                        
+                        # Require multiple consecutive chunks with speech before starting recording
+                        # This prevents false positives from brief noise or background sounds
+                        if has_speech:
+                            self._speech_chunks_count += 1
+                        else:
+                            self._speech_chunks_count = 0  # Reset if we hit silence
+                        
+                        # Update speech detection status (only after confirmation)
+                        if (self._speech_chunks_count >= config.VOICE_VAD_CONFIRMATION_CHUNKS and 
+                            not self.speech_detected_ref[0]):
+                            self.speech_detected_ref[0] = True
+                            self.on_speech()
+                            print(f"[INFO] Speech confirmed! Starting recording...")
+                            # Move pre-buffer to main buffer (keep only last few chunks before confirmed speech)
+                            keep_chunks = len(self.pre_buffer)
+                            if keep_chunks > 0:
+                                for buffered in self.pre_buffer:
+                                    self.append_pcm(buffered)
+                                if config.VOICE_DEBUG_LOGGING:
                                     print(f"[DEBUG] Added {keep_chunks} pre-buffered chunks to capture speech start")
-                            
-                            # Add to appropriate buffer
-                            if self.speech_detected_ref[0]:
-                                # Speech detected - add to main buffer
-                                self.audio_buffer.append(audio_array)
-                                self.last_audio_time_ref[0] = time.time()
-                                # Print first few chunks and then every 50 to reduce noise
-                                chunk_duration = len(audio_array) / 48000  # seconds
-                                if len(self.audio_buffer) <= 5 or len(self.audio_buffer) % 50 == 0:
-                                    print(f"[DEBUG] ✓ Received chunk #{len(self.audio_buffer)} from {user_name}: {chunk_duration:.3f}s, total: {len(self.audio_buffer)} chunks")
-                            else:
-                                # No speech yet - add to pre-buffer (limited size)
-                                self.pre_buffer.append(audio_array)
-                                if len(self.pre_buffer) > config.VOICE_PREBUFFER_SIZE * 2:
-                                    # Keep only recent chunks
-                                    self.pre_buffer = self.pre_buffer[-config.VOICE_PREBUFFER_SIZE:]
+                        
+                        # Add to appropriate buffer
+                        if self.speech_detected_ref[0]:
+                            # Speech detected - add to main buffer
+                            self.append_pcm(pcm_data)
+                            self.last_audio_time_ref[0] = time.time()
+                            # Print first few chunks and then every 50 to reduce noise
+                            if config.VOICE_DEBUG_LOGGING and (self.chunk_count <= 5 or self.chunk_count % 50 == 0):
+                                chunk_duration = len(pcm_data) / (2 * DISCORD_CHANNELS * DISCORD_SAMPLE_RATE)  # seconds
+                                print(f"[DEBUG] ✓ Received chunk #{self.chunk_count} from {_display_name(user)}: {chunk_duration:.3f}s, total: {self.chunk_count} chunks")
                         else:
-                            print(f"[WARNING] VoiceData from {user_name} has no pcm attribute or pcm is None/empty")
+                            # No speech yet - add to pre-buffer (deque drops the oldest chunk when full)
+                            self.pre_buffer.append(pcm_data)
+                    else:
+                        print(f"[WARNING] VoiceData from {_display_name(user)} has no pcm attribute or pcm is None/empty")
+                        if config.VOICE_DEBUG_LOGGING:
                             if hasattr(data, 'pcm'):
                                 print(f"[DEBUG] data.pcm exists but is: {data.pcm}")
                             else:
                                 print(f"[DEBUG] data.pcm attribute does not exist. Data attributes: {[a for a in dir(data) if not a.startswith('_')]}")
-                    elif user:
-                        # Log audio from other users (only first time to reduce noise)
-                        if len(self.audio_buffer) == 0:
-                            print(f"[DEBUG] ✗ Received audio from {user_name} (ID: {user_id_received}), but target is {self.target_user_id} - IGNORING")
-                    else:
-                        # No user info - this shouldn't happen but log it
-                        if len(self.audio_buffer) < 5:
-                            print(f"[WARNING] write() called with user=None")
                 except Exception as e:
                     print(f"[ERROR] Exception in sink.write(): {e}")
                     import traceback
@@ -214,7 +374,14 @@ class AudioRecorder:
                 pass
         
         speech_detected = [False]  # Use list to allow modification in nested function
-        sink = UserAudioSink(user_id, self.audio_buffer, self.pre_buffer, speech_detected, last_audio_time)
+        # The sink runs on voice_recv's thread, so it wakes the wait loop below thread-safely
+        speech_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        on_speech = lambda: loop.call_soon_threadsafe(speech_event.set)
+        # Size the PCM buffer for the whole timeout (48kHz stereo) with some headroom
+        max_samples = int(timeout * DISCORD_SAMPLE_RATE * DISCORD_CHANNELS * 1.2)
+        sink = UserAudioSink(user_id, max_samples, self.pre_buffer, speech_detected, last_audio_time, on_speech)
+        self.sink = sink
         
         # Use the listen() method - this is the correct way to start receiving audio
         # It doesn't require audio to be flowing first
@@ -255,35 +422,46 @@ class AudioRecorder:
         # Wait for recording with silence detection
         # Use time.time() for consistency with the sink's time tracking
         start_time = time.time()
+        deadline = start_time + timeout
         silence_threshold = config.VOICE_SILENCE_THRESHOLD
         min_recording_time = config.VOICE_MIN_RECORDING_TIME
+        next_progress = start_time + 1.0
         
-        while (time.time() - start_time) < timeout:
-            await asyncio.sleep(0.1)
-            
+        # Sleep until the next thing that can happen (speech starting, the silence cutoff,
+        # the next once-a-second progress line or the timeout) instead of polling
+        while True:
             current_time = time.time()
+            if current_time >= deadline:
+                break
             elapsed = current_time - start_time
+            stop_time = deadline
             
             # Check if we have recent audio (only after speech is detected)
             if speech_detected[0] and last_audio_time[0] is not None:
-                time_since_audio = current_time - last_audio_time[0]
-                has_detected_speech = len(self.audio_buffer) > 0
-                
-                # Check for silence-based early stop
-                if (elapsed >= min_recording_time and 
-                    has_detected_speech and 
-                    time_since_audio >= silence_threshold):
+                # Silence-based early stop: no audio for silence_threshold, after min_recording_time
+                stop_time = max(last_audio_time[0] + silence_threshold, start_time + min_recording_time)
+                if current_time >= stop_time and sink.pcm_len > 0:
                     print(f"[INFO] Silence detected, stopping recording early at {elapsed:.1f}s")
                     break
-            elif not speech_detected[0]:
-                # Still waiting for speech - show waiting message
-                if int(elapsed) != int(elapsed - 0.1) and int(elapsed) > 0:  # Every second
+            
+            if current_time >= next_progress:
+                if speech_detected[0]:
+                    # Progress updates (only after speech is detected)
+                    buffer_info = f", {sink.chunk_count} chunks" if sink.chunk_count else ""
+                    print(f"[INFO] Recording... {elapsed:.1f}s{buffer_info}")
+                else:
+                    # Still waiting for speech - show waiting message
                     print(f"[INFO] Waiting for speech... {elapsed:.1f}s")
+                next_progress = start_time + int(elapsed) + 1.0
             
-            # Progress updates (only after speech is detected)
-            if speech_detected[0] and int(elapsed) != int(elapsed - 0.1) and int(elapsed) > 0:  # Every second
-                buffer_info = f", {len(self.audio_buffer)} chunks" if self.audio_buffer else ""
-                print(f"[INFO] Recording... {elapsed:.1f}s{buffer_info}")
+            delay = max(min(deadline, stop_time, next_progress) - current_time, 0.01)
+            if speech_event.is_set():
+                await asyncio.sleep(delay)
+            else:
+                try:
+                    await asyncio.wait_for(speech_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
         
         # Stop recording - stop listening
         try:
@@ -295,7 +473,7 @@ class AudioRecorder:
             print(f"[WARNING] Error stopping listening: {e}")
         
         # Process and save audio
-        if len(self.audio_buffer) == 0:
+        if sink.pcm_len == 0:
             if not speech_detected[0]:
                 print("[WARNING] No speech detected during recording period")
                 print("[DEBUG] The bot was listening but didn't detect any speech above the threshold")
@@ -309,40 +487,37 @@ class AudioRecorder:
             self.recording = False
             return None
         
-        # Combine all audio chunks
-        audio_data = np.concatenate(self.audio_buffer)
+        # Recorded audio is already contiguous in the sink's buffer
+        audio_data = sink.pcm[:sink.pcm_len]
         
         # Normalize audio to prevent clipping and improve quality
         # Discord audio can sometimes be at max volume, causing clipping
-        max_val = np.abs(audio_data).max()
+        max_val = max(int(audio_data.max()), -int(audio_data.min()))
         if max_val > 0:
             # Normalize to 90% of max to prevent clipping
             # This helps preserve audio quality for transcription
-            audio_data = audio_data.astype(np.float32) / max_val * 0.9
-            # Convert back to int16 for WAV file
-            audio_data = (audio_data * 32767).astype(np.int16)
-        
-        # Save to WAV file
-        sample_rate = 48000  # Discord's sample rate
-        channels = 1  # Mono
-        
-        with wave.open(str(filepath), 'wb') as wf:
-            wf.setnchannels(channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(sample_rate)
-            wf.writeframes(audio_data.tobytes())
-        
-        absolute_path = filepath.resolve()
-        self.recorded_file = str(absolute_path)
+            _normalize_in_place(audio_data, max_val)
+        
+        # Hand over Discord's raw interleaved PCM as-is; the transcriber downmixes
+        # and decimates it to 16kHz mono in one pass
+        self.recorded_audio = RecordedAudio(audio_data, DISCORD_SAMPLE_RATE, DISCORD_CHANNELS)
         self.recording = False
         
-        file_size = absolute_path.stat().st_size
-        duration = len(audio_data) / sample_rate
-        print(f"[INFO] Recording saved to {absolute_path} ({file_size} bytes, {duration:.2f}s)")
+        duration = len(audio_data) / (DISCORD_SAMPLE_RATE * DISCORD_CHANNELS)
+        print(f"[INFO] Recording complete ({duration:.2f}s)")
+        
+        if config.VOICE_SAVE_RECORDINGS:
+            self._save_recording(user_id)
         
-        return self.recorded_file
+        return self.recorded_audio
     
-    async def _record_from_microphone_fallback(self, user_id: int, timeout: float) -> Optional[str]:
+    def _save_recording(self, user_id: int):
+        """Write the current recording to data/audio as a WAV file (for debugging)."""
+        filepath = _new_recording_path(user_id)
+        _write_wav(filepath, *self.recorded_audio)
+        print(f"[INFO] Recording saved to {filepath.resolve()} ({filepath.stat().st_size} bytes)")
+    
+    async def _record_from_microphone_fallback(self, user_id: int, timeout: float) -> Optional[RecordedAudio]:
         """Fallback: Record from system microphone using PyAudio."""
         print("[WARNING] Using system microphone fallback")
         print("[WARNING] This will record from THIS computer's microphone, not Discord voice channel")
@@ -350,132 +525,129 @@ class AudioRecorder:
         self.target_user_id = user_id
         self.recording = True
         
-        # Prepare output file
-        data_dir = Path("data/audio")
-        data_dir.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"recording_{user_id}_{timestamp}.wav"
-        filepath = data_dir / filename
-        
         try:
-            import pyaudio
-            
-            # Audio parameters
-            chunk = 1024
-            sample_format = pyaudio.paInt16
-            sample_rate = 48000
+            # PyAudio reads block, so record in a worker thread to keep the event loop
+            # (and Discord heartbeats) running
+            self.recorded_audio = await asyncio.to_thread(self._record_microphone_blocking, timeout)
+            self.recording = False
             
-            # Initialize PyAudio
-            p = pyaudio.PyAudio()
+            if config.VOICE_SAVE_RECORDINGS:
+                self._save_recording(user_id)
             
-            try:
-                # Get default input device
-                try:
-                    default_device = p.get_default_input_device_info()
-                    max_channels = int(default_device['maxInputChannels'])
-                    device_name = default_device['name']
-                    device_index = default_device['index']
-                    print(f"[INFO] Using microphone: {device_name} (Device {device_index}, {max_channels} channels)")
-                    channels = 1 if max_channels >= 1 else max_channels
-                except Exception as e:
-                    print(f"[WARNING] Could not get device info: {e}, using mono")
-                    channels = 1
-                    device_index = None
+            return self.recorded_audio
                 
-                # Open audio stream
-                stream_kwargs = {
-                    'format': sample_format,
-                    'channels': channels,
-                    'rate': sample_rate,
-                    'frames_per_buffer': chunk,
-                    'input': True
-                }
-                if device_index is not None:
-                    stream_kwargs['input_device_index'] = device_index
-                
-                stream = p.open(**stream_kwargs)
+        except ImportError:
+            print("[ERROR] PyAudio not installed. Install with: pip install pyaudio")
+            self.recording = False
+            return None
+        except Exception as e:
+            print(f"[ERROR] Error recording audio: {e}")
+            import traceback
+            traceback.print_exc()
+            self.recording = False
+            return None
+    
+    def _record_microphone_blocking(self, timeout: float) -> RecordedAudio:
+        """Record from the system microphone (blocking, run in a worker thread)."""
+        import pyaudio
+        
+        # Audio parameters
+        chunk = 1024
+        batch_chunks = 8  # Chunks read (and silence-checked) per stream.read call
+        sample_format = pyaudio.paInt16
+        sample_rate = 48000
+        
+        p, channels, device_index = _get_microphone()
+        
+        # Open audio stream
+        stream_kwargs = {
+            'format': sample_format,
+            'channels': channels,
+            'rate': sample_rate,
+            'frames_per_buffer': chunk,
+            'input': True
+        }
+        if device_index is not None:
+            stream_kwargs['input_device_index'] = device_index
+        
+        stream = p.open(**stream_kwargs)
+        
+        print(f"[INFO] Recording from microphone for up to {timeout} seconds...")
+        print(f"[INFO] Please speak now! Recording will stop automatically when you finish.")
+        
+        # Record audio with silence detection into a buffer sized for the full timeout
+        num_chunks = int(sample_rate / chunk * timeout)
+        audio_buf = np.empty(num_chunks * chunk * channels, dtype=np.int16)
+        samples_recorded = 0
+        level_checked = 0
+        chunks_per_second = sample_rate // chunk
+        silence_threshold_chunks = int(config.VOICE_SILENCE_THRESHOLD * chunks_per_second)
+        min_recording_chunks = int(config.VOICE_MIN_RECORDING_TIME * chunks_per_second)
+        silence_chunks = 0
+        has_detected_speech = False
+        max_level_seen = 0.0
+        progress_lines = []  # printed after the stream closes so console I/O doesn't stall reads
+        
+        chunk_samples = chunk * channels
+        
+        try:
+            batch_start_chunk = 0
+            stopped = False
+            while batch_start_chunk < num_chunks and not stopped:
+                if not self.recording:
+                    break
                 
-                print(f"[INFO] Recording from microphone for up to {timeout} seconds...")
-                print(f"[INFO] Please speak now! Recording will stop automatically when you finish.")
+                n = min(batch_chunks, num_chunks - batch_start_chunk)
+                data = stream.read(chunk * n, exception_on_overflow=False)
+                audio_data = np.frombuffer(data, dtype=np.int16)
+                batch_offset = samples_recorded
+                audio_buf[samples_recorded:samples_recorded + audio_data.size] = audio_data
+                samples_recorded += audio_data.size
                 
-                # Record audio with silence detection
-                frames = []
-                num_chunks = int(sample_rate / chunk * timeout)
-                chunks_per_second = sample_rate // chunk
-                silence_threshold_chunks = int(config.VOICE_SILENCE_THRESHOLD * chunks_per_second)
-                min_recording_chunks = int(config.VOICE_MIN_RECORDING_TIME * chunks_per_second)
-                silence_chunks = 0
-                has_detected_speech = False
-                max_level_seen = 0.0
+                # Check the whole batch against the integer threshold in one pass,
+                # giving one "has sound" flag per chunk
+                per_chunk = audio_data.reshape(n, chunk_samples)
+                loud_chunks = (
+                    (per_chunk >= SILENCE_INT16_THRESHOLD) | (per_chunk <= -SILENCE_INT16_THRESHOLD)
+                ).any(axis=1).tolist()
                 
-                for i in range(num_chunks):
-                    if not self.recording:
-                        break
+                for j, is_loud in enumerate(loud_chunks):
+                    i = batch_start_chunk + j
+                    chunk_end = batch_offset + (j + 1) * chunk_samples
                     
-                    data = stream.read(chunk, exception_on_overflow=False)
-                    frames.append(data)
-                    
-                    # Check audio level
-                    audio_data = np.frombuffer(data, dtype=np.int16)
-                    max_level = np.abs(audio_data).max() / 32768.0
-                    max_level_seen = max(max_level_seen, max_level)
-                    
-                    is_silent = max_level < config.VOICE_SILENCE_LEVEL
-                    
-                    if not is_silent:
+                    if is_loud:
                         has_detected_speech = True
                         silence_chunks = 0
                     else:
                         silence_chunks += 1
                     
-                    # Early stop on silence
+                    # Early stop on silence (drop the rest of the batch, as if it was never read)
                     if (i >= min_recording_chunks and 
                         has_detected_speech and 
                         silence_chunks >= silence_threshold_chunks):
+                        samples_recorded = chunk_end
                         seconds_recorded = (i + 1) * chunk / sample_rate
-                        print(f"[INFO] Silence detected, stopping recording early at {seconds_recorded:.1f}s")
+                        progress_lines.append(f"[INFO] Silence detected, stopping recording early at {seconds_recorded:.1f}s")
+                        stopped = True
                         break
                     
-                    # Progress updates
+                    # Progress updates (peak level is only needed for logging, so measure it once a second)
                     if (i + 1) % chunks_per_second == 0:
+                        max_level_seen = max(max_level_seen, _peak_level(audio_buf[level_checked:chunk_end]))
+                        level_checked = chunk_end
                         seconds_recorded = (i + 1) * chunk / sample_rate
-                        print(f"[INFO] Recording... {seconds_recorded:.1f}s (max level: {max_level_seen:.4f})")
-                
-                stream.stop_stream()
-                stream.close()
-                
-                # Save to WAV file
-                with wave.open(str(filepath), 'wb') as wf:
-                    wf.setnchannels(channels)
-                    wf.setsampwidth(p.get_sample_size(sample_format))
-                    wf.setframerate(sample_rate)
-                    wf.writeframes(b''.join(frames))
-                
-                print(f"[INFO] Recording complete - Max level: {max_level_seen:.4f}")
-                
-            finally:
-                p.terminate()
-            
-            absolute_path = filepath.resolve()
-            self.recorded_file = str(absolute_path)
-            self.recording = False
-            
-            if absolute_path.exists():
-                file_size = absolute_path.stat().st_size
-                print(f"[INFO] Recording saved to {absolute_path} ({file_size} bytes)")
-                return self.recorded_file
-            else:
-                print(f"[ERROR] File was not created: {absolute_path}")
-                return None
+                        progress_lines.append(f"[INFO] Recording... {seconds_recorded:.1f}s (max level: {max_level_seen:.4f})")
                 
-        except ImportError:
-            print("[ERROR] PyAudio not installed. Install with: pip install pyaudio")
-            self.recording = False
-            return None
-        except Exception as e:
-            print(f"[ERROR] Error recording audio: {e}")
-            import traceback
-            traceback.print_exc()
-            self.recording = False
-            return None
+                batch_start_chunk += n
+        finally:
+            stream.stop_stream()
+            stream.close()
+        
+        if progress_lines:
+            print("\n".join(progress_lines))
+        
+        max_level_seen = max(max_level_seen, _peak_level(audio_buf[level_checked:samples_recorded]))
+        
+        print(f"[INFO] Recording complete - Max level: {max_level_seen:.4f}")
+        
+        return RecordedAudio(audio_buf[:samples_recorded], sample_rate, channels)
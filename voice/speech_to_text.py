@@ -1,34 +1,149 @@
 """Speech-to-text using OpenAI Whisper."""
 
-import whisper
 import asyncio
+import math
 import os
-import shutil
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import signal
+
+import config
+
+# Prefer faster-whisper (CTranslate2 backend); fall back to the reference openai-whisper
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    import torch
+    import whisper
+    FASTER_WHISPER_AVAILABLE = False
+    print("[WARNING] faster-whisper not installed. Install with: pip install faster-whisper")
+    print("[WARNING] Falling back to openai-whisper (slower).")
+
+# Optional: libsndfile reader for WAV input (falls back to the wave module)
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDFILE_AVAILABLE = False
+
+# Optional: Numba-compiled 48kHz -> 16kHz decimator (falls back to scipy's resample_poly)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Whisper models take 16kHz mono audio
+WHISPER_SAMPLE_RATE = 16000
+
+# Discord voice sample rate (exactly 3x Whisper's)
+DISCORD_SAMPLE_RATE = 48000
+
+# Anti-aliasing FIR for 3:1 decimation, the same Kaiser design resample_poly uses for 48kHz -> 16kHz
+_DECIMATE_FIR = signal.firwin(61, 1.0 / 3, window=('kaiser', 5.0)).astype(np.float32)
+
+# Warm float32 decode buffer size: 30 s at Discord's 48kHz (grown if a recording is longer)
+DECODE_BUFFER_SAMPLES = 30 * 48000
+
+# Recordings whose peak stays below this are treated as silence and not transcribed
+SILENT_PEAK_LEVEL = 0.01
+
+# WAV sample width -> (sample dtype, scale to [-1, 1], offset after scaling)
+_PCM_FORMATS = {
+    1: (np.uint8, np.float32(1.0 / 128.0), np.float32(-1.0)),
+    2: (np.int16, np.float32(1.0 / 32768.0), None),
+    4: (np.int32, np.float32(1.0 / 2147483648.0), None),
+}
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _decimate_3x_int16(pcm, channels, fir, scale, out):
+        """Downmix, low-pass and decimate interleaved int16 PCM by 3 into out, in one pass."""
+        frames = pcm.size // channels
+        half = fir.size // 2
+        for i in numba.prange(out.size):
+            acc = np.float32(0.0)
+            start = i * 3 - half
+            for k in range(fir.size):
+                j = start + k
+                if 0 <= j < frames:
+                    frame_sum = 0
+                    for c in range(channels):
+                        frame_sum += pcm[j * channels + c]
+                    acc += fir[k] * frame_sum
+            out[i] = acc * scale
 
 
 class WhisperSTT:
     """Whisper speech-to-text handler."""
     
-    def __init__(self, model_name: str = "base"):
+    def __init__(self, model_name: str = "tiny.en"):
         """Initialize Whisper model."""
         self.model_name = model_name
         self.model = None
+        # One dedicated thread owns the model, so concurrent attempts queue up in order
+        # instead of running the same (non-thread-safe) model from several pool threads
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+        # Recordings are decoded into this buffer instead of a fresh float32 array per attempt
+        # (only touched from the executor thread, so one buffer is enough)
+        self._audio_buf = np.empty(DECODE_BUFFER_SAMPLES, dtype=np.float32)
         self._load_model()
     
     def _load_model(self):
         """Load Whisper model (synchronous, called at startup)."""
         print(f"Loading Whisper model: {self.model_name}...")
-        self.model = whisper.load_model(self.model_name)
+        if FASTER_WHISPER_AVAILABLE:
+            # int8 weights on CPU; fp16 activations with int8 weights on GPU
+            if ctranslate2.get_cuda_device_count() > 0:
+                device, compute_type = "cuda", "int8_float16"
+            else:
+                device, compute_type = "cpu", "int8"
+            self.model = WhisperModel(self.model_name, device=device, compute_type=compute_type, num_workers=1)
+            print(f"[INFO] faster-whisper running on {device} ({compute_type})")
+        else:
+            # Decode in fp16 when the model ends up on CUDA
+            self.model = _load_openai_whisper(self.model_name)
+            self._fp16 = self.model.device.type == "cuda"
+            print(f"[INFO] openai-whisper running on {self.model.device} ({'fp16' if self._fp16 else 'fp32'})")
+            if os.getenv("WHISPER_COMPILE") == "1":
+                self._compile_model()
+        if NUMBA_AVAILABLE:
+            # Compile (or load from cache) the decimator now rather than on the first attempt
+            decimate_48k_to_16k(np.zeros(DISCORD_SAMPLE_RATE // 100, dtype=np.int16), 1)
         print(f"Whisper model loaded successfully!")
     
-    async def transcribe(self, audio_file_path: str, initial_prompt: Optional[str] = None) -> Optional[str]:
+    def _compile_model(self):
+        """Compile the openai-whisper encoder/decoder with torch.compile (opt-in via WHISPER_COMPILE=1)."""
+        print("[INFO] Compiling Whisper encoder/decoder with torch.compile...")
+        # Encoder input is always a 30 s mel window; the decoder grows with the KV cache
+        self.model.encoder = torch.compile(self.model.encoder, mode="reduce-overhead")
+        self.model.decoder = torch.compile(self.model.decoder, dynamic=True)
+        
+        # Warm up here so the first player's attempt doesn't pay the compile time
+        self.model.transcribe(np.zeros(WHISPER_SAMPLE_RATE * 30, dtype=np.float32), language="en", fp16=self._fp16, verbose=None)
+        print("[INFO] Whisper compile warmup done")
+    
+    def _decode_buffer(self, num_samples: int) -> np.ndarray:
+        """Get a float32 view of the warm decode buffer with room for num_samples samples."""
+        if num_samples > self._audio_buf.size:
+            self._audio_buf = np.empty(num_samples, dtype=np.float32)
+        return self._audio_buf[:num_samples]
+    
+    async def transcribe(self, audio, initial_prompt: Optional[str] = None) -> Optional[str]:
         """
-        Transcribe audio file to text asynchronously.
+        Transcribe a recording to text asynchronously.
         
         Args:
-            audio_file_path: Path to audio file
+            audio: In-memory recording as a (samples, sample_rate, channels) tuple of
+                int16 PCM (e.g. voice.recorder.RecordedAudio), or a path to a WAV file
+            initial_prompt: Optional text to guide transcription (e.g. the expected tongue twister)
             
         Returns:
             Transcribed text or None if transcription fails
@@ -36,272 +151,283 @@ class WhisperSTT:
         if not self.model:
             raise RuntimeError("Whisper model not loaded")
         
-        # Convert to absolute path and normalize
-        audio_path = Path(audio_file_path)
-        if not audio_path.is_absolute():
-            audio_path = audio_path.resolve()
-        
-        # Normalize the path (handle Windows path issues)
-        audio_file_path = str(audio_path.absolute())
-        
-        # Verify file exists and is readable
-        if not audio_path.exists():
-            print(f"[ERROR] Audio file not found: {audio_file_path}")
-            print(f"[DEBUG] Current working directory: {os.getcwd()}")
-            return None
-        
-        if not audio_path.is_file():
-            print(f"[ERROR] Path is not a file: {audio_file_path}")
-            return None
-        
-        # Check file size (should not be empty)
-        file_size = audio_path.stat().st_size
-        if file_size == 0:
-            print(f"[ERROR] Audio file is empty: {audio_file_path}")
-            return None
-        
-        print(f"[DEBUG] Transcribing file: {audio_file_path} (size: {file_size} bytes)")
-        
-        # Get absolute path
-        abs_path = audio_path.resolve()
-        
-        # On Windows, use C:\temp\ which has NO SPACES and is guaranteed to work
-        # This is the ONLY reliable way to avoid path issues with Whisper/ffmpeg
-        if os.name == 'nt':
-            # Use C:\temp\ which has no spaces
-            temp_dir = Path("C:/temp")
-            temp_dir.mkdir(parents=True, exist_ok=True)
-        else:
-            # On Unix, use project temp directory
-            temp_dir = Path("data/temp")
-            temp_dir.mkdir(parents=True, exist_ok=True)
-        
-        temp_filename = f"whisper_{os.getpid()}_{abs_path.name}"
-        temp_path = temp_dir / temp_filename
-        
-        try:
-            # Copy file to temp directory (not symlink - more reliable)
-            shutil.copy2(abs_path, temp_path)
+        if isinstance(audio, tuple):
+            # Recordings are passed straight from the recorder, no WAV round-trip
+            samples, pcm_sample_rate, channels = audio
+            source = f"in-memory recording ({samples.size} samples at {pcm_sample_rate}Hz)"
             
-            # Ensure file is fully written and flushed
-            temp_path_abs = temp_path.resolve()
-            file_path_for_whisper = str(temp_path_abs)
+            def load_audio():
+                if NUMBA_AVAILABLE and pcm_sample_rate == DISCORD_SAMPLE_RATE:
+                    out = self._decode_buffer(decimated_length(samples.size // channels))
+                    return decimate_48k_to_16k(samples, channels, out=out), WHISPER_SAMPLE_RATE
+                return pcm_to_mono(samples, pcm_sample_rate, channels, out=self._decode_buffer(samples.size))
+        else:
+            audio_path = Path(audio).resolve()
+            source = str(audio_path)
             
-            # Verify the copy succeeded
-            if not temp_path_abs.exists():
-                raise FileNotFoundError(f"File copy failed - destination doesn't exist: {temp_path_abs}")
+            # Verify file exists and is not empty
+            if not audio_path.is_file():
+                print(f"[ERROR] Audio file not found: {audio_path}")
+                if config.STT_DEBUG_LOGGING:
+                    print(f"[DEBUG] Current working directory: {os.getcwd()}")
+                return None
             
-            # Get file size to verify it's complete
-            copied_size = temp_path_abs.stat().st_size
-            if copied_size != file_size:
-                raise ValueError(f"File copy incomplete: source={file_size}, dest={copied_size}")
+            if audio_path.stat().st_size == 0:
+                print(f"[ERROR] Audio file is empty: {audio_path}")
+                return None
             
-            print(f"[DEBUG] Copied file to temp location (no spaces): {file_path_for_whisper}")
-            print(f"[DEBUG] Copied file size: {copied_size} bytes (matches source: {copied_size == file_size})")
-        except Exception as e:
-            print(f"[ERROR] Could not copy file to temp directory: {e}")
-            # Fallback to original path
-            file_path_for_whisper = str(abs_path)
-            temp_path = None
+            load_audio = lambda: load_wav_mono(audio_path)
         
-        print(f"[DEBUG] Final file path for Whisper: {file_path_for_whisper}")
-        
-        # Verify we can actually open the file before passing to Whisper
-        try:
-            test_path = Path(file_path_for_whisper)
-            with open(test_path, 'rb') as test_file:
-                test_file.read(1)  # Read one byte to verify access
-            print(f"[DEBUG] File is readable")
-        except Exception as e:
-            print(f"[ERROR] Cannot read file: {e}")
-            return None
+        if config.STT_DEBUG_LOGGING:
+            print(f"[DEBUG] Transcribing {source}")
         
-        # Run transcription in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        try:
-            def transcribe_file():
-                # Use the file path from outer scope
-                path_to_use = file_path_for_whisper
-                
-                # Double-check file exists in executor thread with detailed logging
-                print(f"[DEBUG] Executor thread checking file: {path_to_use}")
-                print(f"[DEBUG] Executor thread file exists check: {os.path.exists(path_to_use)}")
-                print(f"[DEBUG] Executor thread current dir: {os.getcwd()}")
-                
-                if not os.path.exists(path_to_use):
-                    # Try with absolute path
-                    abs_check = Path(path_to_use).resolve()
-                    print(f"[DEBUG] Executor thread trying absolute path: {abs_check}")
-                    print(f"[DEBUG] Executor thread absolute exists: {abs_check.exists()}")
-                    if not abs_check.exists():
-                        raise FileNotFoundError(f"File not found in executor: {path_to_use} (absolute: {abs_check})")
-                    path_to_use = str(abs_check)
-                
-                # Verify file is accessible (but don't keep it open)
-                print(f"[DEBUG] Executor thread verifying file access...")
-                try:
-                    # Open and immediately close to verify access without locking
-                    with open(path_to_use, 'rb') as f:
-                        f.read(1)  # Read one byte to verify
-                    print(f"[DEBUG] Executor thread file verified and closed")
-                except Exception as e:
-                    print(f"[ERROR] Executor thread cannot access file: {e}")
-                    raise
-                
-                # Small delay to ensure file handle is fully released
-                import time
-                time.sleep(0.1)
-                
-                # Pass the path to Whisper - use absolute path with backslashes (Windows native)
-                # Don't use forward slashes - Whisper on Windows expects native path format
-                abs_path_final = Path(path_to_use).resolve()
-                whisper_path = str(abs_path_final)
-                print(f"[DEBUG] Executor thread calling Whisper with path: {whisper_path}")
-                print(f"[DEBUG] Executor thread path type check: {type(whisper_path)}")
-                
-                # Double-check file still exists right before calling Whisper
-                if not abs_path_final.exists():
-                    raise FileNotFoundError(f"File disappeared before Whisper call: {abs_path_final}")
-                
-                # Verify file is still accessible
-                try:
-                    with open(abs_path_final, 'rb') as test:
-                        test.read(1)
-                    print(f"[DEBUG] File verified accessible right before Whisper call")
-                except Exception as e:
-                    raise FileNotFoundError(f"File not accessible right before Whisper: {e}")
-                
-                # Call Whisper - read WAV file directly using Python libraries to avoid ffmpeg path issues
-                # whisper.load_audio() also uses ffmpeg, so we'll read the file ourselves
-                print(f"[DEBUG] Reading WAV file directly to avoid ffmpeg path issues...")
-                
-                # Read WAV file using wave library (no ffmpeg needed)
-                import wave
-                import numpy as np
-                from scipy import signal
-                
-                with wave.open(whisper_path, 'rb') as wav_file:
-                    # Get audio parameters
-                    frames = wav_file.getnframes()
-                    sample_rate = wav_file.getframerate()
-                    channels = wav_file.getnchannels()
-                    sample_width = wav_file.getsampwidth()
-                    
-                    # Read all frames
-                    audio_bytes = wav_file.readframes(frames)
-                    
-                    # Convert to numpy array
-                    if sample_width == 1:
-                        dtype = np.uint8
-                        audio_array = np.frombuffer(audio_bytes, dtype=dtype).astype(np.float32) / 128.0 - 1.0
-                    elif sample_width == 2:
-                        dtype = np.int16
-                        audio_array = np.frombuffer(audio_bytes, dtype=dtype).astype(np.float32) / 32768.0
-                    elif sample_width == 4:
-                        dtype = np.int32
-                        audio_array = np.frombuffer(audio_bytes, dtype=dtype).astype(np.float32) / 2147483648.0
-                    else:
-                        raise ValueError(f"Unsupported sample width: {sample_width}")
-                    
-                    # Handle stereo to mono conversion if needed
-                    if channels == 2:
-                        audio_array = audio_array.reshape(-1, 2).mean(axis=1)
-                    elif channels > 2:
-                        audio_array = audio_array.reshape(-1, channels).mean(axis=1)
-                
+        def transcribe_audio():
+            audio_array, sample_rate = load_audio()
+            if config.STT_DEBUG_LOGGING:
                 print(f"[DEBUG] Audio loaded, shape: {audio_array.shape}, sample_rate: {sample_rate}")
-                
-                # Check audio level (to detect if it's silent)
-                max_amplitude = np.abs(audio_array).max()
-                rms = np.sqrt(np.mean(audio_array**2))
+            
+            # Check audio level before resampling, so silent recordings skip resample and Whisper
+            max_amplitude = float(np.abs(audio_array).max()) if audio_array.size else 0.0
+            if config.STT_DEBUG_LOGGING:
+                rms = np.sqrt(np.mean(audio_array**2)) if audio_array.size else 0.0
                 print(f"[DEBUG] Audio stats - Max amplitude: {max_amplitude:.4f}, RMS: {rms:.4f}")
-                
-                if max_amplitude < 0.01:
-                    print(f"[WARNING] Audio appears to be very quiet or silent (max amplitude: {max_amplitude})")
-                
-                # Normalize audio to prevent clipping (if max is at 1.0, it's clipping)
-                if max_amplitude >= 0.99:
-                    print(f"[WARNING] Audio is clipping (max amplitude: {max_amplitude:.4f}). Normalizing...")
-                    # Normalize to 0.95 max to prevent clipping distortion
-                    audio_array = audio_array / max_amplitude * 0.95
+            
+            if max_amplitude < SILENT_PEAK_LEVEL:
+                print(f"[WARNING] Audio appears to be very quiet or silent (max amplitude: {max_amplitude}), skipping transcription")
+                return ""
+            
+            # Normalize audio to prevent clipping (if max is at 1.0, it's clipping)
+            if max_amplitude >= 0.99:
+                print(f"[WARNING] Audio is clipping (max amplitude: {max_amplitude:.4f}). Normalizing...")
+                # Normalize to 0.95 max to prevent clipping distortion
+                audio_array *= np.float32(0.95 / max_amplitude)
+                if config.STT_DEBUG_LOGGING:
                     print(f"[DEBUG] Normalized audio - new max: {np.abs(audio_array).max():.4f}")
-                
-                # Whisper expects audio at 16kHz, so resample if necessary
-                target_sample_rate = 16000
-                if sample_rate != target_sample_rate:
-                    num_samples = int(len(audio_array) * target_sample_rate / sample_rate)
-                    audio_array = signal.resample(audio_array, num_samples)
-                    print(f"[DEBUG] Resampled from {sample_rate}Hz to {target_sample_rate}Hz, new shape: {audio_array.shape}")
-                else:
-                    print(f"[DEBUG] Audio already at {target_sample_rate}Hz, no resampling needed")
-                
+            
+            audio_array = resample_to_16k(audio_array, sample_rate)
+            
+            if config.STT_DEBUG_LOGGING:
                 print(f"[DEBUG] Calling Whisper transcribe with audio array...")
-                # Use better transcription parameters for improved accuracy
-                transcribe_kwargs = {
-                    "language": "en",  # Specify English for better accuracy
-                    "task": "transcribe",  # Explicit transcription task
-                    "fp16": False,  # Use FP32 for better accuracy (we're on CPU anyway)
-                    "verbose": False,  # Reduce noise in output
-                    "temperature": 0,  # Deterministic output (no randomness)
-                    "best_of": 5,  # Try 5 different decodings and pick the best
-                    "beam_size": 5,  # Beam search width for better accuracy
-                    "condition_on_previous_text": False,  # Don't bias based on previous text
-                }
-                
-                # Add initial prompt if provided (helps guide transcription)
-                if initial_prompt:
-                    transcribe_kwargs["initial_prompt"] = initial_prompt
+            # Use better transcription parameters for improved accuracy
+            transcribe_kwargs = {
+                "language": "en",  # Specify English for better accuracy
+                "task": "transcribe",  # Explicit transcription task
+                "temperature": 0,  # Deterministic output (no randomness)
+                "best_of": 5,  # Try 5 different decodings and pick the best
+                "beam_size": 5,  # Beam search width for better accuracy
+                "condition_on_previous_text": False,  # Don't bias based on previous text
+            }
+            
+            # Add initial prompt if provided (helps guide transcription)
+            if initial_prompt:
+                transcribe_kwargs["initial_prompt"] = initial_prompt
+                if config.STT_DEBUG_LOGGING:
                     print(f"[DEBUG] Using initial prompt to guide transcription: '{initial_prompt[:50]}...'")
-                
-                result = self.model.transcribe(audio_array, **transcribe_kwargs)
-                print(f"[DEBUG] Whisper transcription completed")
-                print(f"[DEBUG] Whisper result keys: {result.keys() if isinstance(result, dict) else 'not a dict'}")
-                if isinstance(result, dict):
-                    print(f"[DEBUG] Whisper result text: '{result.get('text', 'NO TEXT KEY')}'")
-                    print(f"[DEBUG] Whisper result language: {result.get('language', 'NO LANGUAGE KEY')}")
-                return result
             
-            result = await loop.run_in_executor(None, transcribe_file)
-            text = result.get("text", "").strip()
-            print(f"[DEBUG] Transcription result: {text[:50]}..." if len(text) > 50 else f"[DEBUG] Transcription result: {text}")
+            if FASTER_WHISPER_AVAILABLE:
+                # Segments are generated lazily; joining them runs the decode
+                # vad_filter runs the bundled Silero VAD first, so only voiced audio is decoded
+                # (silent recordings come back with no segments)
+                segments, info = self.model.transcribe(
+                    audio_array.astype(np.float32, copy=False),
+                    vad_filter=True,
+                    **transcribe_kwargs
+                )
+                text = "".join(segment.text for segment in segments)
+                if config.STT_DEBUG_LOGGING:
+                    print(f"[DEBUG] Whisper transcription completed")
+                    print(f"[DEBUG] Whisper result language: {info.language}")
+            else:
+                # inference_mode also skips the autograd version counters no_grad keeps
+                with torch.inference_mode():
+                    result = self.model.transcribe(
+                        audio_array,
+                        fp16=self._fp16,  # FP16 on GPU; FP32 on CPU (fp16 isn't supported there)
+                        verbose=False,  # Reduce noise in output
+                        **transcribe_kwargs
+                    )
+                text = result.get("text", "")
+                if config.STT_DEBUG_LOGGING:
+                    print(f"[DEBUG] Whisper transcription completed")
+                    print(f"[DEBUG] Whisper result language: {result.get('language', 'NO LANGUAGE KEY')}")
+            if config.STT_DEBUG_LOGGING:
+                print(f"[DEBUG] Whisper result text: '{text}'")
+            return text
+        
+        # Run transcription on the model's worker thread to avoid blocking
+        loop = asyncio.get_running_loop()
+        try:
+            text = await loop.run_in_executor(self._executor, transcribe_audio)
+            text = text.strip()
+            if config.STT_DEBUG_LOGGING:
+                print(f"[DEBUG] Transcription result: {text[:50]}..." if len(text) > 50 else f"[DEBUG] Transcription result: {text}")
             return text if text else None
         except FileNotFoundError as e:
-            print(f"[ERROR] File not found during transcription: {file_path_for_whisper}")
+            print(f"[ERROR] File not found during transcription: {source}")
             print(f"[ERROR] Error details: {e}")
-            print(f"[ERROR] Current working directory in executor: {os.getcwd()}")
             return None
         except Exception as e:
             print(f"[ERROR] Error transcribing audio: {e}")
-            print(f"[ERROR] File path was: {file_path_for_whisper}")
-            print(f"[ERROR] File exists: {os.path.exists(file_path_for_whisper)}")
+            print(f"[ERROR] Audio was: {source}")
             import traceback
             traceback.print_exc()
             return None
-        finally:
-            # Clean up copied file if we created one
-            # IMPORTANT: Only clean up AFTER transcription completes successfully
-            # Don't delete during transcription as Whisper/ffmpeg might still need it
-            if temp_path:
-                try:
-                    # Small delay to ensure Whisper/ffmpeg has fully released the file
-                    await asyncio.sleep(0.5)
-                    temp_path_abs = temp_path.resolve()
-                    if temp_path_abs.exists():
-                        temp_path_abs.unlink()
-                        print(f"[DEBUG] Cleaned up temp file: {temp_path_abs}")
-                    else:
-                        print(f"[DEBUG] Temp file already gone: {temp_path_abs}")
-                except Exception as e:
-                    print(f"[WARNING] Could not delete temp file {temp_path}: {e}")
+
+
+def _load_openai_whisper(model_name: str):
+    """
+    Load an openai-whisper model.
+    
+    Uses whisper.load_model, except for a local checkpoint file with WHISPER_MMAP=1: that is
+    memory-mapped instead of read and unpickled in full, so restarts reuse the OS page cache
+    and no pickled code runs.
+    
+    Args:
+        model_name: Whisper model name (e.g. "tiny.en") or a checkpoint path
+        
+    Returns:
+        Loaded Whisper model (on CUDA when available)
+    """
+    if os.getenv("WHISPER_MMAP") != "1" or not os.path.isfile(model_name):
+        return whisper.load_model(model_name)
+    
+    try:
+        checkpoint = torch.load(model_name, map_location="cpu", mmap=True, weights_only=True)
+        model = whisper.model.Whisper(whisper.model.ModelDimensions(**checkpoint["dims"]))
+        # Copies the (fp16) checkpoint tensors into the fp32 module, like whisper.load_model
+        model.load_state_dict(checkpoint["model_state_dict"])
+    except Exception as e:
+        # Older torch (no mmap/weights_only) or an unexpected checkpoint layout
+        print(f"[WARNING] Memory-mapped Whisper load failed ({e}), using whisper.load_model")
+        return whisper.load_model(model_name)
+    
+    return model.to("cuda" if torch.cuda.is_available() else "cpu")
+
+
+def _read_wav_float32(path):
+    """Read a PCM WAV file with the wave module as interleaved float32 samples in [-1, 1]."""
+    with wave.open(str(path), 'rb') as wav_file:
+        # Get audio parameters
+        frames = wav_file.getnframes()
+        sample_rate = wav_file.getframerate()
+        channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        
+        # Read all frames
+        audio_bytes = wav_file.readframes(frames)
+    
+    # Convert to float32 (one copy, then scaled in place)
+    if sample_width not in _PCM_FORMATS:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+    dtype, scale, offset = _PCM_FORMATS[sample_width]
+    audio_array = np.frombuffer(audio_bytes, dtype=dtype).astype(np.float32)
+    audio_array *= scale
+    if offset:
+        audio_array += offset
+    return audio_array, sample_rate, channels
+
+
+def pcm_to_mono(samples: np.ndarray, sample_rate: int, channels: int,
+                out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, int]:
+    """
+    Convert interleaved int16 PCM to mono float32 samples.
+    
+    Args:
+        samples: Interleaved int16 samples
+        sample_rate: Sample rate of the samples
+        channels: Number of interleaved channels
+        out: Optional float32 array of samples.size to decode into (avoids allocating one)
+        
+    Returns:
+        Tuple of (1-D float32 array in [-1, 1], sample rate)
+    """
+    _, scale, _ = _PCM_FORMATS[2]
+    # int16 -> float32 conversion and scaling in one pass
+    audio_array = np.multiply(samples, scale, out=out, dtype=np.float32)
+    if channels > 1:
+        audio_array = audio_array.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+    return audio_array, sample_rate
+
+
+def decimated_length(frames: int) -> int:
+    """Number of 16kHz samples produced from frames 48kHz frames (matches resample_poly)."""
+    return (frames + 2) // 3
+
+
+def decimate_48k_to_16k(samples: np.ndarray, channels: int,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert interleaved 48kHz int16 PCM straight to 16kHz mono float32 (requires numba).
+    
+    Same result as pcm_to_mono followed by resample_to_16k, without the intermediate arrays.
+    
+    Args:
+        samples: Interleaved int16 samples at 48kHz
+        channels: Number of interleaved channels
+        out: Optional float32 array of decimated_length(frames) to write into
+        
+    Returns:
+        1-D float32 array in [-1, 1] at 16kHz
+    """
+    if out is None:
+        out = np.empty(decimated_length(samples.size // channels), dtype=np.float32)
+    _, scale, _ = _PCM_FORMATS[2]
+    _decimate_3x_int16(samples, channels, _DECIMATE_FIR, np.float32(scale / channels), out)
+    return out
+
+
+def load_wav_mono(path) -> Tuple[np.ndarray, int]:
+    """
+    Read a PCM WAV file as mono float32 samples at its own sample rate.
+    
+    Args:
+        path: Path to the WAV file
+        
+    Returns:
+        Tuple of (1-D float32 array in [-1, 1], sample rate)
+    """
+    if SOUNDFILE_AVAILABLE:
+        # libsndfile decodes straight into a float32 (frames, channels) array
+        audio_array, sample_rate = sf.read(str(path), dtype='float32', always_2d=True)
+        channels = audio_array.shape[1]
+    else:
+        audio_array, sample_rate, channels = _read_wav_float32(path)
+    
+    # Handle stereo to mono conversion if needed
+    if channels > 1:
+        audio_array = audio_array.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+    else:
+        audio_array = audio_array.reshape(-1)
+    
+    return audio_array, sample_rate
+
+
+def resample_to_16k(audio_array: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Resample mono float32 audio to 16kHz (Whisper's input rate)."""
+    # Whisper expects audio at 16kHz, so resample if necessary
+    # (polyphase FIR: 48kHz -> 16kHz is just up=1, down=3, no full-length FFT)
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        g = math.gcd(sample_rate, WHISPER_SAMPLE_RATE)
+        audio_array = signal.resample_poly(
+            audio_array, WHISPER_SAMPLE_RATE // g, sample_rate // g
+        ).astype(np.float32, copy=False)
+        if config.STT_DEBUG_LOGGING:
+            print(f"[DEBUG] Resampled from {sample_rate}Hz to {WHISPER_SAMPLE_RATE}Hz")
+    
+    return audio_array
 
 
 # Global instance (will be initialized in main.py)
 whisper_stt: Optional[WhisperSTT] = None
 
 
-def initialize_whisper(model_name: str = "base") -> WhisperSTT:
-    """Initialize global Whisper instance."""
+def initialize_whisper(model_name: str = "tiny.en") -> WhisperSTT:
+    """Initialize global Whisper instance (reused if the same model is already loaded)."""
     global whisper_stt
+    # on_ready fires again after reconnects; don't reload/requantize the model each time
+    if whisper_stt is not None and whisper_stt.model_name == model_name and whisper_stt.model:
+        print(f"[INFO] Whisper model {model_name} already loaded, reusing it")
+        return whisper_stt
     whisper_stt = WhisperSTT(model_name)
     return whisper_stt
 